@@ -0,0 +1,109 @@
+"""
+Calendar Assistant Skill - Demo
+
+Walkthrough of skill discovery, manual event creation and natural language
+parsing. Kept out of calendar_skill.py so importing the skill (e.g. during
+tool discovery) doesn't compile or load the demo code.
+
+Run with: python calendar_skill.py
+"""
+
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+
+def example_usage() -> None:
+    """Example of how to use the Calendar Assistant Skill"""
+    try:
+        from .calendar_skill import (
+            CalendarAssistantSkill,
+            _discover_skills_cached,
+            _json_dumps,
+            generate_skills_xml,
+        )
+    except ImportError:
+        from calendar_skill import (
+            CalendarAssistantSkill,
+            _discover_skills_cached,
+            _json_dumps,
+            generate_skills_xml,
+        )
+    
+    print("\n" + "="*60)
+    print("Calendar Assistant Skill - Agent Skills API Compliant")
+    print("="*60 + "\n")
+    
+    # Demonstrate skill discovery
+    print("🔍 Discovering skills...")
+    current_dir = str(Path(__file__).parent.parent)
+    skills = _discover_skills_cached(current_dir, os.stat(current_dir).st_mtime_ns)
+    
+    if skills:
+        print(f"✅ Found {len(skills)} skill(s):\n")
+        for skill in skills:
+            print(f"  - {skill['name']}: {skill['description'][:80]}...")
+            print(f"    Location: {skill['location']}\n")
+        
+        print("📝 Generated XML for agent prompt:")
+        print(generate_skills_xml(skills))
+        print()
+    
+    print("="*60 + "\n")
+    
+    # Check for API key
+    api_key = os.getenv("NVIDIA_API_KEY")
+    if not api_key:
+        print("⚠️  Note: NVIDIA_API_KEY environment variable not set")
+        print("   Natural language parsing will be unavailable\n")
+    
+    # Initialize skill
+    try:
+        skill = CalendarAssistantSkill(api_key=api_key, default_timezone="UTC")
+        print("✅ Skill initialized successfully\n")
+        
+        # Show skill info
+        info = skill.get_skill_info()
+        print("📊 Skill Information:")
+        print(_json_dumps(info))
+        print("\n" + "="*60 + "\n")
+        
+        # Example 1: Create event manually
+        print("🧪 Testing manual event creation...")
+        start_time = datetime.now(skill._utc) + timedelta(days=1, hours=14)
+        ics_content = skill.create_calendar_event(
+            summary="Team Standup Meeting",
+            start_datetime=start_time,
+            duration_hours=0.5,
+            description="Daily team synchronization",
+            location="Conference Room A",
+            reminder_hours=1.0
+        )
+        print(f"✅ Created ICS file ({len(ics_content)} bytes)")
+        print("   Event: Team Standup Meeting")
+        print(f"   Start: {start_time.strftime('%Y-%m-%d %H:%M %Z')}")
+        print(f"   Duration: 30 minutes\n")
+        
+        # Example 2: Natural language parsing
+        if api_key:
+            print("🧪 Testing natural language parsing...")
+            ics_content, error, parsed_data = skill.natural_language_to_ics(
+                "Schedule a client presentation tomorrow at 2pm for 2 hours"
+            )
+            if error:
+                print(f"❌ Error: {error}")
+            else:
+                print("✅ Successfully parsed and created event:")
+                print(f"   {_json_dumps(parsed_data)}")
+                print(f"✅ Created ICS file ({len(ics_content)} bytes)\n")
+        else:
+            print("⚠️  Skipping natural language test (no API key)")
+            print("   Set NVIDIA_API_KEY to test this feature\n")
+        
+        print("="*60 + "\n")
+        print("✅ All tests completed successfully!")
+        print("\n" + "="*60 + "\n")
+        
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        exit(1)
@@ -0,0 +1,237 @@
+"""
+Calendar Assistant Skill - Direct ICS serialization
+
+Writes RFC 5545 lines for the common event shape without building an
+icalendar object tree; output matches what icalendar produces.
+
+The module is plain, fully annotated Python with no third-party imports
+so it can be compiled ahead of time:
+
+    cd calendar_assistant_skill/scripts && mypyc calendar_fastpath.py
+
+The resulting extension module takes precedence over this file on import;
+without it the pure-Python version is used unchanged.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+
+ICS_DT_FORMAT = "%Y%m%dT%H%M%S"
+
+# Zone keys icalendar treats as UTC: written as "...Z" rather than with a
+# TZID parameter (aliases of UTC and zones fixed at UTC)
+UTC_TZIDS = frozenset({
+    "UTC", "UCT", "Universal", "Zulu", "GMT", "GMT+0", "GMT-0", "GMT0",
+    "Greenwich", "Iceland", "Etc/UTC", "Etc/UCT", "Etc/Universal", "Etc/Zulu",
+    "Etc/GMT", "Etc/GMT+0", "Etc/GMT-0", "Etc/GMT0", "Etc/Greenwich",
+    "Africa/Abidjan", "Africa/Accra", "Africa/Bamako", "Africa/Banjul",
+    "Africa/Conakry", "Africa/Dakar", "Africa/Freetown", "Africa/Lome",
+    "Africa/Nouakchott", "Africa/Ouagadougou", "Africa/Timbuktu",
+    "Atlantic/Reykjavik", "Atlantic/St_Helena"
+})
+
+
+def ics_text(value: str) -> str:
+    """Escape a TEXT value (order matters to avoid double escaping)"""
+    # Deliberately a replace() chain: each call is a C-level scan that
+    # returns quickly when the character is absent, while str.translate()
+    # with multi-character replacements takes CPython's slow path and
+    # measures roughly 5x slower on typical summaries
+    return (
+        value.replace("\\N", "\n")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def ics_fold(line: str, limit: int = 75) -> str:
+    """Fold a content line to fewer than 75 octets per physical line"""
+    if len(line) < limit and line.isascii():
+        return line
+    folded: List[str] = []
+    current: List[str] = []
+    byte_count = 0
+    for char in line:
+        char_len = len(char.encode('utf-8'))
+        if current and byte_count + char_len >= limit:
+            # Don't split a backslash escape across the fold
+            if len(current) > 1 and current[-1] in "\\^":
+                carried = current.pop()
+                folded.append("".join(current))
+                current = [carried]
+                byte_count = len(carried.encode('utf-8'))
+            else:
+                folded.append("".join(current))
+                current = []
+                byte_count = 0
+        current.append(char)
+        byte_count += char_len
+    if current:
+        folded.append("".join(current))
+    return "\r\n ".join(folded)
+
+
+def ics_duration(td: timedelta) -> str:
+    """Format a timedelta as an RFC 5545 DURATION value"""
+    sign = ""
+    if td.days < 0:
+        sign = "-"
+        td = -td
+    timepart = ""
+    if td.seconds:
+        hours = td.seconds // 3600
+        minutes = td.seconds % 3600 // 60
+        seconds = td.seconds % 60
+        timepart = "T"
+        if hours:
+            timepart += f"{hours}H"
+        if minutes or (hours and seconds):
+            timepart += f"{minutes}M"
+        if seconds:
+            timepart += f"{seconds}S"
+    if td.days == 0 and timepart:
+        return f"{sign}P{timepart}"
+    return f"{sign}P{td.days}D{timepart}"
+
+
+def ics_datetime(name: str, dt: datetime) -> Optional[str]:
+    """
+    Format a DATE-TIME property line
+    
+    Returns None for tzinfo objects without an IANA key (e.g. fixed
+    offsets); those are left to icalendar.
+    """
+    tzinfo = dt.tzinfo
+    if tzinfo is None:
+        return f"{name}:{dt.strftime(ICS_DT_FORMAT)}"
+    key = getattr(tzinfo, "key", None)
+    if key in UTC_TZIDS or tzinfo is timezone.utc:
+        return f"{name}:{dt.strftime(ICS_DT_FORMAT)}Z"
+    if key:
+        return f"{name};TZID={key}:{dt.strftime(ICS_DT_FORMAT)}"
+    return None
+
+
+# Characters that make icalendar double-quote a parameter value; CN is also
+# quoted for spaces and apostrophes
+PARAM_QUOTABLE = ",;:\u2019"
+CN_QUOTABLE = PARAM_QUOTABLE + " '"
+
+DEFAULT_ROLE = "REQ-PARTICIPANT"
+
+
+def ics_param(value: str, quotable: str) -> Optional[str]:
+    """
+    Format a parameter value, quoting it where icalendar would
+    
+    Returns None for values needing RFC 6868 escaping (quotes, carets,
+    control characters); those are left to icalendar.
+    """
+    if not value.isprintable() or '"' in value or "^" in value:
+        return None
+    for char in quotable:
+        if char in value:
+            return f'"{value}"'
+    return value
+
+
+def ics_address(
+    name: str, 
+    email: str, 
+    cn: Optional[str], 
+    role: Optional[str] = None
+) -> Optional[str]:
+    """Format an ORGANIZER/ATTENDEE line; None if a value needs icalendar"""
+    if not email.isprintable():
+        return None
+    params = ""
+    if cn is not None:
+        quoted_cn = ics_param(cn, CN_QUOTABLE)
+        if quoted_cn is None:
+            return None
+        params += ";CN=" + quoted_cn
+    if role is not None:
+        quoted_role = ics_param(role, PARAM_QUOTABLE)
+        if quoted_role is None:
+            return None
+        params += ";ROLE=" + quoted_role
+    return ics_fold(f"{name}{params}:mailto:{email}")
+
+
+def fast_ics_bytes(
+    summary: str,
+    dtstart: datetime,
+    dtend: datetime,
+    dtstamp: datetime,
+    uid: str,
+    description: str = "",
+    location: str = "",
+    reminder_hours: float = 0.0,
+    organizer_email: str = "",
+    organizer_name: str = "",
+    attendees: Optional[List[Dict[str, str]]] = None
+) -> Optional[bytes]:
+    """
+    Serialize a VEVENT (with optional display alarm) straight to bytes
+    
+    Returns None when a datetime can't be expressed without icalendar's
+    timezone handling, or an organizer/attendee value needs escaping;
+    the caller then falls back to icalendar.
+    """
+    start_line = ics_datetime("DTSTART", dtstart)
+    end_line = ics_datetime("DTEND", dtend)
+    if start_line is None or end_line is None:
+        return None
+    
+    # DTSTAMP is always UTC; naive values are taken to be UTC already
+    if dtstamp.tzinfo is not None:
+        dtstamp = dtstamp.astimezone(timezone.utc)
+    stamp_line = f"DTSTAMP:{dtstamp.strftime(ICS_DT_FORMAT)}Z"
+    
+    summary_text = ics_text(summary)
+    lines = [
+        "BEGIN:VEVENT",
+        ics_fold("SUMMARY:" + summary_text),
+        start_line,
+        end_line,
+        stamp_line,
+        ics_fold("UID:" + ics_text(uid)),
+    ]
+    # Remaining properties in icalendar's (alphabetical) order
+    if attendees:
+        for attendee in [a for a in attendees if 'email' in a]:
+            email = attendee['email']
+            name = attendee.get('name', email)
+            role = attendee.get('role', DEFAULT_ROLE)
+            if not (isinstance(email, str) and isinstance(name, str) and isinstance(role, str)):
+                return None
+            attendee_line = ics_address("ATTENDEE", email, name, role)
+            if attendee_line is None:
+                return None
+            lines.append(attendee_line)
+    if description:
+        lines.append(ics_fold("DESCRIPTION:" + ics_text(description)))
+    if location:
+        lines.append(ics_fold("LOCATION:" + ics_text(location)))
+    if organizer_email:
+        organizer_line = ics_address(
+            "ORGANIZER", organizer_email, organizer_name or None
+        )
+        if organizer_line is None:
+            return None
+        lines.append(organizer_line)
+    if reminder_hours > 0:
+        lines += [
+            "BEGIN:VALARM",
+            "ACTION:DISPLAY",
+            ics_fold("DESCRIPTION:Reminder: " + summary_text),
+            "TRIGGER:" + ics_duration(timedelta(hours=-reminder_hours)),
+            "END:VALARM",
+        ]
+    lines.append("END:VEVENT\r\n")
+    return "\r\n".join(lines).encode('utf-8')
@@ -11,14 +11,21 @@ Agent Skills Python API specification and NAT tool auto-discovery.
 """
 
 import os
+import re
+import string
 import sys
+import time
+import functools
+import threading
+import importlib.util
 from datetime import datetime, timedelta
-from icalendar import Calendar, Event, vCalAddress, vText, Alarm
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import zoneinfo
+from types import MappingProxyType
 import json
 import hashlib
-from typing import Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, BinaryIO, Dict, FrozenSet, Iterator, List, Mapping, Optional, Set, Tuple, Any
 
 # Import skill_tool decorator from skill_loader
 # Handle import whether running as module or standalone
@@ -43,11 +50,52 @@ except ImportError:
             return decorator
 
 try:
-    from langchain_nvidia_ai_endpoints import ChatNVIDIA
-    from langchain_core.messages import SystemMessage, HumanMessage
-    LANGCHAIN_AVAILABLE = True
+    import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
-    LANGCHAIN_AVAILABLE = False
+    yaml = None
+    _YamlLoader = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+    
+    ORJSON_AVAILABLE = False
+
+try:
+    # RE2 matches in linear time without backtracking; fall back to stdlib re
+    import re2 as _re_engine
+    RE2_AVAILABLE = True
+except ImportError:
+    _re_engine = re
+    RE2_AVAILABLE = False
+
+# icalendar and langchain are imported on first use; only check langchain is
+# installed here so metadata/discovery calls don't pay for their import graphs
+LANGCHAIN_AVAILABLE = (
+    importlib.util.find_spec("langchain_nvidia_ai_endpoints") is not None
+    and importlib.util.find_spec("langchain_core") is not None
+)
+
+# Optional semantic parse cache; imported only when enabled on a skill
+SEMANTIC_CACHE_AVAILABLE = (
+    importlib.util.find_spec("sentence_transformers") is not None
+    and importlib.util.find_spec("faiss") is not None
+)
+
+# Populated by _load_icalendar() on first event creation
+Event = vCalAddress = vText = Alarm = None
 
 try:
     from colorama import Fore, Style
@@ -62,6 +110,361 @@ except ImportError:
         RESET_ALL = ""
 
 
+# Same escaping as xml.sax.saxutils.escape, which would pull in urllib and
+# http.client at import time
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _xml_escape(data: str) -> str:
+    """Escape &, < and > for XML text content"""
+    return data.translate(_XML_ESCAPE)
+
+
+def _load_icalendar() -> None:
+    """Import the icalendar classes into module globals on first use"""
+    global Event, vCalAddress, vText, Alarm
+    if Event is None:
+        from icalendar import Event, vCalAddress, vText, Alarm
+
+
+if TYPE_CHECKING:
+    import zoneinfo
+
+
+@functools.lru_cache(maxsize=1)
+def _available_timezones() -> Optional[FrozenSet[str]]:
+    """
+    IANA names known to this system, enumerated once on first validation
+    
+    Returns None if the tz database could not be enumerated; callers then
+    fall back to constructing the ZoneInfo directly.
+    """
+    import zoneinfo
+    try:
+        return frozenset(zoneinfo.available_timezones())
+    except Exception:
+        return None
+
+
+# Matches a ```json or bare ``` fenced block in an LLM response
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Canonical "YYYY-MM-DDTHH:MM" date/time, validated and split in one match
+_EVENT_RE = _re_engine.compile(r'^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}))?$')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_zoneinfo(name: str) -> "zoneinfo.ZoneInfo":
+    """Return a cached ZoneInfo instance for an IANA timezone name"""
+    import zoneinfo
+    return zoneinfo.ZoneInfo(name)
+
+
+def _read_frontmatter(path) -> Optional[str]:
+    """
+    Read only the YAML frontmatter block of a SKILL.md file
+    
+    Stops at the closing '---' line so the markdown body is never read.
+    
+    Args:
+        path: Path to the SKILL.md file
+    
+    Returns:
+        Frontmatter text between the '---' markers, or None if there is none
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip() != '---':
+            return None
+        lines = []
+        for line in f:
+            if line.rstrip() == '---':
+                return ''.join(lines)
+            lines.append(line)
+    return None
+
+
+def _parse_iso_date(s: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date without going through strptime
+    
+    Falls back to strptime for non-canonical input such as "2026-1-5".
+    
+    Raises:
+        ValueError: If the string is not a valid date
+    """
+    if len(s) == 10 and s[4] == '-' and s[7] == '-' and s[:4].isdigit() \
+            and s[5:7].isdigit() and s[8:].isdigit():
+        return datetime(int(s[:4]), int(s[5:7]), int(s[8:]))
+    return datetime.strptime(s, '%Y-%m-%d')
+
+
+def _parse_hhmm(s: str) -> Tuple[int, int]:
+    """
+    Parse an HH:MM time into (hour, minute)
+    
+    Unpadded forms like "9:30" are accepted too.
+    
+    Raises:
+        ValueError: If the string is not of the form H:MM or HH:MM
+    """
+    if len(s) == 5 and s[2] == ':':
+        return int(s[:2]), int(s[3:])
+    hour, minute = map(int, s.split(':'))
+    return hour, minute
+
+
+# ============================================================================
+# Direct ICS serialization
+# The VEVENT writer lives in calendar_fastpath so it can be compiled with
+# mypyc; events it can't express fall back to icalendar.
+# ============================================================================
+
+# VCALENDAR envelope is identical for every calendar we emit
+_VCAL_HEADER = (
+    b"BEGIN:VCALENDAR\r\n"
+    b"VERSION:2.0\r\n"
+    b"PRODID:-//Calendar Assistant Agent Skill//EN\r\n"
+    b"CALSCALE:GREGORIAN\r\n"
+)
+_VCAL_FOOTER = b"END:VCALENDAR\r\n"
+
+# Direct serializer for the common event shape (compiled when built with mypyc)
+try:
+    from .calendar_fastpath import fast_ics_bytes as _fast_ics_bytes
+except ImportError:
+    # Loaded by file path (e.g. tool discovery) rather than as a package
+    scripts_dir = str(Path(__file__).parent)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    from calendar_fastpath import fast_ics_bytes as _fast_ics_bytes
+
+
+# LLM settings; model and temperature are also part of the parse cache key.
+# A parsed event is a ~150 byte JSON object, so a small completion budget
+# suffices (batch calls scale it by the number of requests).
+_LLM_MODEL = "meta/llama-3.1-405b-instruct"
+_LLM_TEMPERATURE = 0.0
+_LLM_MAX_TOKENS = 256
+
+
+# Static instructions, schema and example that open every parse request.
+# Providers with automatic prefix caching (NVIDIA NIM, OpenAI-compatible
+# endpoints) only reuse a prefix that is byte-identical across calls, so
+# per-call values (date, timezone, request) belong in the user message
+# and must never be interpolated here. The skills XML is appended after
+# this block and only changes when a SKILL.md file does.
+_SYSTEM_PROMPT_STATIC = """You are a calendar assistant. Parse user requests into structured event data.
+Return ONLY a valid JSON object with these fields:
+{
+    "summary": "Event title",
+    "description": "Event description",
+    "start_date": "YYYY-MM-DD",
+    "start_time": "HH:MM",
+    "duration_hours": float,
+    "location": "Location (optional)",
+    "organizer_email": "email@example.com (optional)",
+    "organizer_name": "Name (optional)",
+    "reminder_hours": 1
+}
+
+Each request states the current date and timezone; resolve relative dates against them.
+
+Example input: "Schedule a team meeting tomorrow at 2pm for 2 hours about Q4 planning"
+Example output: {"summary": "Team Meeting - Q4 Planning", "start_date": "2026-01-13", "start_time": "14:00", "duration_hours": 2.0, "description": "Quarterly planning discussion", "reminder_hours": 1}
+
+IMPORTANT: Return ONLY the JSON object, no explanations."""
+
+# JSON schema for a single parsed event. Endpoints with guided decoding
+# (NIM's guided_json / OpenAI response_format) constrain generation to it,
+# so replies arrive as bare, well-formed JSON with the required fields.
+_EVENT_SCHEMA: Dict[str, Any] = {
+    "title": "EventData",
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "description": {"type": "string"},
+        "start_date": {"type": "string", "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$"},
+        "start_time": {"type": "string", "pattern": "^[0-9]{2}:[0-9]{2}$"},
+        "duration_hours": {"type": "number"},
+        "location": {"type": "string"},
+        "organizer_email": {"type": "string"},
+        "organizer_name": {"type": "string"},
+        "reminder_hours": {"type": "number"},
+    },
+    "required": ["summary", "start_date", "start_time"],
+}
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping; a maxsize of 0 disables caching"""
+    
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def put(self, key: str, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class _TTLCache:
+    """Small thread-safe mapping whose entries expire; a ttl of 0 disables caching"""
+    
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+    
+    def put(self, key: str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class _SQLiteCache:
+    """
+    Parsed events persisted in SQLite so restarts don't start cold
+    
+    WAL mode lets several app processes share one database file. Entries
+    older than ttl_seconds are ignored on read and replaced on write.
+    """
+    
+    def __init__(self, path: str, ttl_seconds: float) -> None:
+        import sqlite3
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache "
+            "(key TEXT PRIMARY KEY, payload BLOB, ts REAL)"
+        )
+        self._db.commit()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload FROM llm_cache WHERE key = ? AND ts > ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        return _json_loads(row[0]) if row is not None else None
+    
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        payload = _json_dumps(value).encode('utf-8')
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, payload, ts) VALUES (?, ?, ?)",
+                (key, payload, time.time())
+            )
+            self._db.commit()
+
+
+class _SemanticCache:
+    """
+    Nearest-neighbour cache of parsed events keyed by input embeddings
+    
+    Catches paraphrases ("meeting tomorrow 2pm" / "set up a meeting for 2pm
+    tomorrow") that the exact-match cache misses. Entries only match within
+    the same reference day, and the embedding model and FAISS index are
+    built on first use.
+    """
+    
+    def __init__(
+        self, 
+        threshold: float = 0.93, 
+        max_entries: int = 4096,
+        model_name: str = "all-MiniLM-L6-v2"
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._embedder = None
+        self._index = None
+        self._entries: List[Tuple[str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()
+    
+    def _get_embedder(self) -> Any:
+        """
+        Load the embedding model and create the FAISS index exactly once
+        
+        Loading takes seconds, so concurrent first requests would otherwise
+        each build an index and the later one would replace an index that
+        already holds entries, leaving FAISS ids out of step with _entries.
+        The index is assigned before the embedder, so a non-None embedder
+        always comes with its index.
+        """
+        embedder = self._embedder
+        if embedder is None:
+            with self._init_lock:
+                embedder = self._embedder
+                if embedder is None:
+                    import faiss
+                    from sentence_transformers import SentenceTransformer
+                    embedder = SentenceTransformer(self.model_name)
+                    self._index = faiss.IndexFlatIP(
+                        embedder.get_sentence_embedding_dimension()
+                    )
+                    self._embedder = embedder
+        return embedder
+    
+    def _embed(self, text: str) -> Any:
+        # Normalized vectors make inner product equal to cosine similarity
+        return self._get_embedder().encode(
+            [text.strip()], normalize_embeddings=True, convert_to_numpy=True
+        ).astype("float32")
+    
+    def get(self, user_input: str, day: str) -> Optional[Dict[str, Any]]:
+        vector = self._embed(user_input)
+        with self._lock:
+            if not self._entries:
+                return None
+            scores, ids = self._index.search(vector, 1)
+            if ids[0][0] < 0 or scores[0][0] < self.threshold:
+                return None
+            entry_day, event_data = self._entries[ids[0][0]]
+            return event_data if entry_day == day else None
+    
+    def put(self, user_input: str, day: str, event_data: Dict[str, Any]) -> None:
+        vector = self._embed(user_input)
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._index.reset()
+                self._entries.clear()
+            self._index.add(vector)
+            self._entries.append((day, event_data))
+
+
 class CalendarAssistantSkill:
     """
     Calendar management skill for AI agents
@@ -81,46 +484,107 @@ class CalendarAssistantSkill:
         skill_location (Path): Path to SKILL.md file for agent discovery
     """
     
-    def __init__(self, api_key: Optional[str] = None, default_timezone: str = "UTC"):
+    def __init__(
+        self, 
+        api_key: Optional[str] = None, 
+        default_timezone: str = "UTC",
+        parse_cache_size: int = 1024,
+        enable_semantic_cache: bool = False,
+        semantic_cache_threshold: float = 0.93,
+        cache_db_path: Optional[str] = None,
+        cache_ttl_hours: float = 168.0,
+        failed_parse_ttl: float = 30.0
+    ) -> None:
         """
         Initialize the Calendar Assistant Skill
         
         Args:
             api_key: NVIDIA API key for AI parsing (optional, defaults to NVIDIA_API_KEY env var)
             default_timezone: Default timezone for events (default: UTC)
+            parse_cache_size: Max parsed requests kept in memory; 0 disables
+                              the cache (default: 1024)
+            enable_semantic_cache: Also reuse parses of paraphrased requests
+                                   (needs sentence-transformers and faiss;
+                                   default: False)
+            semantic_cache_threshold: Minimum cosine similarity for a
+                                      semantic cache hit (default: 0.93)
+            cache_db_path: SQLite file that persists parsed requests across
+                           restarts and processes (default: None, disabled)
+            cache_ttl_hours: Age after which persisted parses are ignored
+                             (default: 168, one week)
+            failed_parse_ttl: Seconds a failed parse is remembered, so
+                              repeats of the same request return the error
+                              without calling the LLM; 0 disables
+                              (default: 30)
         
         Raises:
             ValueError: If default_timezone is not a valid IANA timezone
         """
         # Validate timezone
+        available_tzs = _available_timezones()
+        if available_tzs is not None and default_timezone not in available_tzs:
+            raise ValueError(f"Invalid timezone: {default_timezone}. Use IANA timezone names.")
+        
+        import zoneinfo
         try:
-            zoneinfo.ZoneInfo(default_timezone)
+            self._tz = _get_zoneinfo(default_timezone)
         except zoneinfo.ZoneInfoNotFoundError:
             raise ValueError(f"Invalid timezone: {default_timezone}. Use IANA timezone names.")
+        self._utc = _get_zoneinfo("UTC")
         
         self.api_key = api_key or os.getenv("NVIDIA_API_KEY")
         self.default_timezone = default_timezone
         self.llm = None
+        # (llm, schema-bound runnable or None), built on first parse
+        self._structured = None
         
         self.version = "1.0.0"
         self.name = "calendar-assistant"
         
         # Skill location for agent discovery
         self.skill_location = Path(__file__).parent.parent / "SKILL.md"
+        self._skill_location_abs = str(self.skill_location.absolute())
+        
+        # Rendered <available_skills> block, invalidated by SKILL.md mtime
+        self._skills_xml_cache = None
+        self._skills_xml_mtime = None
+        
+        # _SYSTEM_PROMPT_STATIC plus the skills XML, rebuilt only when the
+        # skills XML changes
+        self._system_prompt = None
+        self._system_prompt_xml = None
+        
+        # Exact-match cache of parsed events, see _parse_cache_key()
+        self._parse_cache = _LRUCache(parse_cache_size)
+        # Recent failures per cache key, so retries don't re-spend LLM calls
+        self._failed_parses = _TTLCache(failed_parse_ttl)
+        self._persistent_cache = None
+        if cache_db_path:
+            try:
+                self._persistent_cache = _SQLiteCache(cache_db_path, cache_ttl_hours * 3600)
+            except Exception as e:
+                print(f"Warning: Could not open parse cache database: {e}")
+        self._semantic_cache = None
+        if enable_semantic_cache:
+            if SEMANTIC_CACHE_AVAILABLE:
+                self._semantic_cache = _SemanticCache(threshold=semantic_cache_threshold)
+            else:
+                print("Warning: sentence-transformers/faiss not available. Semantic cache disabled.")
         
         if self.api_key and LANGCHAIN_AVAILABLE:
             self._initialize_llm()
         elif self.api_key and not LANGCHAIN_AVAILABLE:
             print("Warning: langchain packages not available. Install langchain-nvidia-ai-endpoints for AI parsing.")
     
-    def _initialize_llm(self):
+    def _initialize_llm(self) -> None:
         """Initialize the NVIDIA LLM for natural language parsing"""
         try:
+            from langchain_nvidia_ai_endpoints import ChatNVIDIA
             self.llm = ChatNVIDIA(
-                model="meta/llama-3.1-405b-instruct",
+                model=_LLM_MODEL,
                 api_key=self.api_key,
-                temperature=0.3,
-                max_completion_tokens=36000
+                temperature=_LLM_TEMPERATURE,
+                max_completion_tokens=_LLM_MAX_TOKENS
             )
         except Exception as e:
             print(f"Warning: Could not initialize LLM: {e}")
@@ -134,6 +598,9 @@ class CalendarAssistantSkill:
         """
         Parse natural language input into structured event data
         
+        Successful parses are cached per normalized input and calendar day,
+        so repeated requests skip the LLM call.
+        
         Args:
             user_input: Natural language description of the event
             reference_date: Reference date for relative dates (default: now)
@@ -154,49 +621,285 @@ class CalendarAssistantSkill:
             return None, "LLM not initialized. Please provide API key and ensure langchain packages are installed."
         
         if reference_date is None:
-            reference_date = datetime.now(zoneinfo.ZoneInfo(self.default_timezone))
+            reference_date = datetime.now(self._tz)
+        
+        cache_key = self._parse_cache_key(user_input, reference_date)
+        cached = self._get_cached_parse(cache_key, user_input, reference_date)
+        if cached is not None:
+            return cached, None
+        recent_error = self._failed_parses.get(cache_key)
+        if recent_error is not None:
+            return None, recent_error
         
         try:
-            current_date = reference_date.strftime("%Y-%m-%d")
-            system_prompt = self._build_system_prompt(current_date)
-            
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_input)
-            ]
-            
-            response = self.llm.invoke(messages)
-            response_text = response.content.strip()
+            messages = self._build_messages(user_input, reference_date)
+            structured = self._get_structured_llm()
+            if structured is not None:
+                result = structured.invoke(messages)
+                event_data, error = self._check_structured_result(result)
+            else:
+                response = self.llm.invoke(messages)
+                event_data, error = self._parse_llm_content(response.content)
             
-            # Extract JSON from potential markdown code blocks
-            if '```json' in response_text:
-                start = response_text.find('```json') + 7
-                end = response_text.find('```', start)
-                response_text = response_text[start:end].strip()
-            elif '```' in response_text:
-                start = response_text.find('```') + 3
-                end = response_text.find('```', start)
-                response_text = response_text[start:end].strip()
+        except json.JSONDecodeError as e:
+            event_data, error = None, f"Error parsing JSON response: {str(e)}"
+        except Exception as e:
+            event_data, error = None, f"Error parsing with AI: {str(e)}"
+        
+        if event_data is not None:
+            self._store_parse(cache_key, user_input, reference_date, event_data)
+        else:
+            self._failed_parses.put(cache_key, error)
+        return event_data, error
+    
+    async def aparse_natural_language(
+        self, 
+        user_input: str, 
+        reference_date: Optional[datetime] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Async version of parse_natural_language using the LLM's ainvoke
+        
+        Lets event loops (Gradio, FastAPI, agent runtimes) keep serving other
+        requests while the model call is in flight.
+        
+        Args:
+            user_input: Natural language description of the event
+            reference_date: Reference date for relative dates (default: now)
             
-            if COLORAMA_AVAILABLE:
-                print(Fore.YELLOW + f"AI extracted calendar info: {response_text}" + Style.RESET_ALL)
+        Returns:
+            Tuple of (event_data dict, error string)
+        
+        Example:
+            >>> data, error = await skill.aparse_natural_language("Meeting tomorrow at 2pm")
+        """
+        if not self.llm:
+            return None, "LLM not initialized. Please provide API key and ensure langchain packages are installed."
+        
+        if reference_date is None:
+            reference_date = datetime.now(self._tz)
+        
+        cache_key = self._parse_cache_key(user_input, reference_date)
+        cached = self._get_cached_parse(cache_key, user_input, reference_date)
+        if cached is not None:
+            return cached, None
+        recent_error = self._failed_parses.get(cache_key)
+        if recent_error is not None:
+            return None, recent_error
+        
+        try:
+            messages = self._build_messages(user_input, reference_date)
+            structured = self._get_structured_llm()
+            if structured is not None:
+                result = await structured.ainvoke(messages)
+                event_data, error = self._check_structured_result(result)
             else:
-                print(f"AI extracted calendar info: {response_text}")
+                response = await self.llm.ainvoke(messages)
+                event_data, error = self._parse_llm_content(response.content)
             
-            event_data = json.loads(response_text)
+        except json.JSONDecodeError as e:
+            event_data, error = None, f"Error parsing JSON response: {str(e)}"
+        except Exception as e:
+            event_data, error = None, f"Error parsing with AI: {str(e)}"
+        
+        if event_data is not None:
+            self._store_parse(cache_key, user_input, reference_date, event_data)
+        else:
+            self._failed_parses.put(cache_key, error)
+        return event_data, error
+    
+    def _parse_cache_key(self, user_input: str, reference_date: datetime) -> str:
+        """
+        Key for the exact-match parse cache
+        
+        Relative phrases like "tomorrow" resolve the same way all day, so the
+        reference date is keyed by calendar day. Model and temperature are
+        included so a settings change never serves stale results.
+        """
+        key = hashlib.blake2b(digest_size=16)
+        key.update(user_input.strip().lower().encode('utf-8'))
+        key.update(
+            f"|{reference_date.date().isoformat()}|{self.default_timezone}"
+            f"|{_LLM_MODEL}|{_LLM_TEMPERATURE}".encode('utf-8')
+        )
+        return key.hexdigest()
+    
+    def _get_cached_parse(
+        self, 
+        cache_key: str, 
+        user_input: str, 
+        reference_date: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a previous parse: memory, then disk, then semantic; returns a copy"""
+        cached = self._parse_cache.get(cache_key)
+        if cached is None and self._persistent_cache is not None:
+            try:
+                cached = self._persistent_cache.get(cache_key)
+            except Exception as e:
+                print(f"Warning: Parse cache database lookup failed: {e}")
+            if cached is not None:
+                self._parse_cache.put(cache_key, cached)
+        if cached is None and self._semantic_cache is not None:
+            try:
+                cached = self._semantic_cache.get(user_input, reference_date.date().isoformat())
+            except Exception as e:
+                print(f"Warning: Semantic cache lookup failed: {e}")
+        return dict(cached) if cached is not None else None
+    
+    def _store_parse(
+        self, 
+        cache_key: str, 
+        user_input: str, 
+        reference_date: datetime, 
+        event_data: Dict[str, Any]
+    ) -> None:
+        """Remember a successful parse in the enabled caches"""
+        snapshot = dict(event_data)
+        self._parse_cache.put(cache_key, snapshot)
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.put(cache_key, snapshot)
+            except Exception as e:
+                print(f"Warning: Parse cache database update failed: {e}")
+        if self._semantic_cache is not None:
+            try:
+                self._semantic_cache.put(user_input, reference_date.date().isoformat(), snapshot)
+            except Exception as e:
+                print(f"Warning: Semantic cache update failed: {e}")
+    
+    def _build_messages(
+        self, 
+        user_input: str, 
+        reference_date: Optional[datetime] = None
+    ) -> List[Any]:
+        """
+        Build the system/user message pair sent to the LLM
+        
+        Args:
+            user_input: Natural language description of the event
+            reference_date: Reference date for relative dates (default: now)
             
-            # Validate required fields
-            required_fields = ['summary', 'start_date', 'start_time']
-            for field in required_fields:
-                if field not in event_data:
-                    return None, f"Missing required field: {field}"
+        Returns:
+            List of langchain messages
+        """
+        from langchain_core.messages import SystemMessage, HumanMessage
+        
+        if reference_date is None:
+            reference_date = datetime.now(self._tz)
+        current_date = reference_date.strftime("%Y-%m-%d")
+        
+        return [
+            SystemMessage(content=self._build_system_prompt()),
+            HumanMessage(content=self._build_user_message(user_input, current_date))
+        ]
+    
+    def _get_structured_llm(self) -> Any:
+        """
+        The LLM bound to _EVENT_SCHEMA, or None if the model can't bind it
+        
+        Built lazily because binding may query the endpoint's model list,
+        and rebuilt if self.llm is replaced.
+        """
+        if self._structured is None or self._structured[0] is not self.llm:
+            try:
+                bound = self.llm.with_structured_output(_EVENT_SCHEMA)
+            except Exception as e:
+                print(f"Warning: Structured output unavailable, parsing raw replies: {e}")
+                bound = None
+            self._structured = (self.llm, bound)
+        return self._structured[1]
+    
+    def _check_structured_result(
+        self, 
+        result: Any
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Validate the dict returned by the schema-bound LLM
+        
+        Args:
+            result: Parsed reply, None when the model's output was incomplete
             
-            return event_data, None
+        Returns:
+            Tuple of (event_data dict, error string)
+        """
+        if not isinstance(result, dict):
+            return None, "AI response did not match the event schema"
+        
+        if COLORAMA_AVAILABLE:
+            print(Fore.YELLOW + f"AI extracted calendar info: {result}" + Style.RESET_ALL)
+        else:
+            print(f"AI extracted calendar info: {result}")
+        
+        error = self._validate_event_data(result)
+        if error:
+            return None, error
+        
+        return result, None
+    
+    def _parse_llm_content(
+        self, 
+        content: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Decode and validate the JSON event returned by the LLM
+        
+        Raises json.JSONDecodeError on malformed output so callers can
+        report it with their own message.
+        
+        Args:
+            content: Raw response content from the LLM
             
-        except json.JSONDecodeError as e:
-            return None, f"Error parsing JSON response: {str(e)}"
-        except Exception as e:
-            return None, f"Error parsing with AI: {str(e)}"
+        Returns:
+            Tuple of (event_data dict, error string)
+        """
+        response_text = self._extract_json_text(content)
+        event_data = _json_loads(response_text.encode('utf-8'))
+        
+        # Validate required fields
+        error = self._validate_event_data(event_data)
+        if error:
+            return None, error
+        
+        return event_data, None
+    
+    def _extract_json_text(self, response_text: str) -> str:
+        """
+        Strip markdown code fences from an LLM response and log the result
+        
+        Args:
+            response_text: Raw LLM response content
+            
+        Returns:
+            The JSON text to decode
+        """
+        response_text = response_text.strip()
+        
+        # Extract JSON from potential markdown code blocks
+        match = _FENCE_RE.search(response_text)
+        if match:
+            response_text = match.group(1).strip()
+        
+        if COLORAMA_AVAILABLE:
+            print(Fore.YELLOW + f"AI extracted calendar info: {response_text}" + Style.RESET_ALL)
+        else:
+            print(f"AI extracted calendar info: {response_text}")
+        
+        return response_text
+    
+    def _validate_event_data(self, event_data: Any) -> Optional[str]:
+        """
+        Check that parsed event data contains the required fields
+        
+        Returns:
+            Error string for the first missing field, or None if valid
+        """
+        if not isinstance(event_data, dict):
+            return "Expected a JSON object for the event"
+        required_fields = ['summary', 'start_date', 'start_time']
+        for field in required_fields:
+            if field not in event_data:
+                return f"Missing required field: {field}"
+        return None
     
     def create_calendar_event(
         self,
@@ -209,8 +912,10 @@ class CalendarAssistantSkill:
         organizer_name: str = "",
         attendees: Optional[List[Dict[str, str]]] = None,
         reminder_hours: float = 1.0,
-        recurrence: Optional[Dict[str, Any]] = None
-    ) -> bytes:
+        recurrence: Optional[Dict[str, Any]] = None,
+        dtstamp: Optional[datetime] = None,
+        out: Optional[BinaryIO] = None
+    ) -> Optional[bytes]:
         """
         Create an iCalendar event (RFC 5545 compliant)
         
@@ -225,9 +930,14 @@ class CalendarAssistantSkill:
             attendees: List of attendee dicts with 'email', 'name', 'role'
             reminder_hours: Hours before event to trigger reminder (default: 1.0)
             recurrence: Recurrence rules (optional, for future use)
+            dtstamp: Creation timestamp (default: now in UTC); pass one value
+                     to share it across a batch of events
+            out: Binary stream to write the ICS content to instead of
+                 returning it, e.g. an open file or HTTP response body
             
         Returns:
-            bytes: ICS file content ready to save or send
+            bytes: ICS file content ready to save or send, or None when
+                   written to out
         
         Raises:
             ValueError: If required parameters are invalid
@@ -245,39 +955,77 @@ class CalendarAssistantSkill:
             >>> with open("event.ics", "wb") as f:
             ...     f.write(ics)
         """
+        event_bytes = self._build_vevent(
+            summary, start_datetime, duration_hours, description, location,
+            organizer_email, organizer_name, attendees, reminder_hours,
+            recurrence, dtstamp
+        )
+        
+        # Streaming skips concatenating the envelope into a new buffer
+        if out is not None:
+            out.write(_VCAL_HEADER)
+            out.write(event_bytes)
+            out.write(_VCAL_FOOTER)
+            return None
+        
+        return _VCAL_HEADER + event_bytes + _VCAL_FOOTER
+    
+    def _build_vevent(
+        self,
+        summary: str,
+        start_datetime: datetime,
+        duration_hours: float,
+        description: str,
+        location: str,
+        organizer_email: str,
+        organizer_name: str,
+        attendees: Optional[List[Dict[str, str]]],
+        reminder_hours: float,
+        recurrence: Optional[Dict[str, Any]],
+        dtstamp: Optional[datetime]
+    ) -> bytes:
+        """Serialize one VEVENT component; see create_calendar_event() for arguments"""
         if not summary:
             raise ValueError("Event summary is required")
         
         if not isinstance(start_datetime, datetime):
             raise ValueError("start_datetime must be a datetime object")
         
-        cal = Calendar()
-        cal.add('prodid', '-//Calendar Assistant Agent Skill//EN')
-        cal.add('version', '2.0')
-        cal.add('calscale', 'GREGORIAN')
-        
-        event = Event()
-        event.add('summary', summary)
-        
         # Ensure datetime has timezone
         if start_datetime.tzinfo is None:
-            start_datetime = start_datetime.replace(
-                tzinfo=zoneinfo.ZoneInfo(self.default_timezone)
-            )
-        
-        event.add('dtstart', start_datetime)
+            start_datetime = start_datetime.replace(tzinfo=self._tz)
         
         # Calculate end time
         end_datetime = start_datetime + timedelta(hours=duration_hours)
-        event.add('dtend', end_datetime)
         
-        # Add timestamp (current time in UTC)
-        event.add('dtstamp', datetime.now(zoneinfo.ZoneInfo("UTC")))
+        # Timestamp (current time in UTC)
+        if dtstamp is None:
+            dtstamp = datetime.now(self._utc)
+        
+        # Generate unique UID. BLAKE2b ships with hashlib, so UIDs stay the
+        # same on every install (an optional blake3 would change them)
+        uid_hash = hashlib.blake2b(digest_size=16)
+        uid_hash.update(summary.encode('utf-8'))
+        uid_hash.update(start_datetime.isoformat().encode('ascii'))
+        uid = f"{uid_hash.hexdigest()}@calendar-assistant-skill"
+        
+        # Common case: serialize directly, skipping the icalendar object tree
+        if not recurrence:
+            event_bytes = _fast_ics_bytes(
+                summary, start_datetime, end_datetime, dtstamp, uid,
+                description, location, reminder_hours,
+                organizer_email, organizer_name, attendees
+            )
+            if event_bytes is not None:
+                return event_bytes
         
-        # Generate unique UID
-        uid_base = f"{summary}{start_datetime.isoformat()}"
-        uid_hash = hashlib.md5(uid_base.encode()).hexdigest()
-        event['uid'] = f"{uid_hash}@calendar-assistant-skill"
+        _load_icalendar()
+        event = Event()
+        event.add('summary', summary)
+        event.add('dtstart', start_datetime)
+        event.add('dtend', end_datetime)
+        event.add('dtstamp', dtstamp)
+        event['uid'] = uid
         
         if location:
             event.add('location', location)
@@ -314,11 +1062,13 @@ class CalendarAssistantSkill:
         if recurrence:
             event.add('rrule', recurrence)
         
-        cal.add_component(event)
-        
-        return cal.to_ical()
+        return event.to_ical()
     
-    def create_event_from_data(self, event_data: Dict[str, Any]) -> bytes:
+    def create_event_from_data(
+        self, 
+        event_data: Dict[str, Any], 
+        dtstamp: Optional[datetime] = None
+    ) -> bytes:
         """
         Create calendar event from parsed data dictionary
         
@@ -326,6 +1076,7 @@ class CalendarAssistantSkill:
             event_data: Dictionary with event fields from parse_natural_language()
                        Must contain: summary, start_date, start_time
                        Optional: duration_hours, description, location, etc.
+            dtstamp: Creation timestamp passed to create_calendar_event()
             
         Returns:
             bytes: ICS file content
@@ -343,32 +1094,85 @@ class CalendarAssistantSkill:
             ... }
             >>> ics = skill.create_event_from_data(data)
         """
-        # Parse datetime
+        return self.create_calendar_event(
+            dtstamp=dtstamp, **self._event_args_from_data(event_data)
+        )
+    
+    def create_events_bulk(
+        self, 
+        events: List[Dict[str, Any]], 
+        dtstamp: Optional[datetime] = None
+    ) -> bytes:
+        """
+        Create one calendar containing an event per parsed data dictionary
+        
+        The VCALENDAR envelope is written once and all events share a single
+        DTSTAMP, so importing N events needs one file instead of N.
+        
+        Args:
+            events: Dictionaries in the create_event_from_data() format
+            dtstamp: Creation timestamp shared by all events (default: now in UTC)
+            
+        Returns:
+            bytes: ICS file content with one VEVENT per input, in order
+        
+        Raises:
+            KeyError: If required fields are missing
+            ValueError: If date/time parsing fails
+        
+        Example:
+            >>> ics = skill.create_events_bulk([
+            ...     {"summary": "Standup", "start_date": "2026-01-13", "start_time": "09:00"},
+            ...     {"summary": "Review", "start_date": "2026-01-13", "start_time": "15:00"}
+            ... ])
+        """
+        if dtstamp is None:
+            dtstamp = datetime.now(self._utc)
+        
+        parts = [_VCAL_HEADER]
+        for event_data in events:
+            parts.append(self._build_vevent(
+                attendees=None, recurrence=None, dtstamp=dtstamp,
+                **self._event_args_from_data(event_data)
+            ))
+        parts.append(_VCAL_FOOTER)
+        return b"".join(parts)
+    
+    def _event_args_from_data(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert parsed event data into create_calendar_event() keyword arguments"""
+        # Parse datetime (fixed-format slicing, strptime only as a fallback)
         try:
-            start_date = datetime.strptime(event_data['start_date'], '%Y-%m-%d')
+            start_date = _parse_iso_date(event_data['start_date'])
         except (KeyError, ValueError) as e:
             raise ValueError(f"Invalid or missing start_date: {e}")
         
-        if event_data.get('start_time'):
+        hour = minute = 0
+        start_time = event_data.get('start_time')
+        if start_time:
             try:
-                hour, minute = map(int, event_data['start_time'].split(':'))
-                start_date = start_date.replace(hour=hour, minute=minute)
+                hour, minute = _parse_hhmm(start_time)
             except ValueError as e:
                 raise ValueError(f"Invalid start_time format: {e}")
         
-        # Add timezone
-        start_date = start_date.replace(tzinfo=zoneinfo.ZoneInfo(self.default_timezone))
+        # Assemble the aware start in one step
+        try:
+            start_date = datetime(
+                start_date.year, start_date.month, start_date.day,
+                hour, minute, tzinfo=self._tz
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid start_time format: {e}")
         
-        return self.create_calendar_event(
-            summary=event_data['summary'],
-            start_datetime=start_date,
-            duration_hours=float(event_data.get('duration_hours', 1.0)),
-            description=event_data.get('description', ''),
-            location=event_data.get('location', ''),
-            organizer_email=event_data.get('organizer_email', ''),
-            organizer_name=event_data.get('organizer_name', ''),
-            reminder_hours=float(event_data.get('reminder_hours', 1.0))
-        )
+        return {
+            'summary': event_data['summary'],
+            'start_datetime': start_date,
+            'duration_hours': float(event_data.get('duration_hours', 1.0)),
+            'description': event_data.get('description', ''),
+            'location': event_data.get('location', ''),
+            'organizer_email': event_data.get('organizer_email', ''),
+            'organizer_name': event_data.get('organizer_name', ''),
+            'reminder_hours': float(event_data.get('reminder_hours', 1.0)),
+        }
     
     def natural_language_to_ics(
         self, 
@@ -409,51 +1213,171 @@ class CalendarAssistantSkill:
         except Exception as e:
             return None, f"Error creating ICS: {str(e)}", event_data
     
-    def _build_system_prompt(self, current_date: str) -> str:
+    async def anatural_language_to_ics(
+        self, 
+        user_input: str
+    ) -> Tuple[Optional[bytes], Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Async version of natural_language_to_ics
+        
+        Only the LLM call is awaited; ICS generation is CPU-bound and fast.
+        
+        Args:
+            user_input: Natural language event description
+            
+        Returns:
+            Tuple of (ics_content bytes, error string, parsed_data dict)
+        
+        Example:
+            >>> ics, error, data = await skill.anatural_language_to_ics(
+            ...     "Schedule team meeting tomorrow at 2pm for 2 hours"
+            ... )
+        """
+        event_data, error = await self.aparse_natural_language(user_input)
+        
+        if error:
+            return None, error, None
+        
+        try:
+            ics_content = self.create_event_from_data(event_data)
+            return ics_content, None, event_data
+        except Exception as e:
+            return None, f"Error creating ICS: {str(e)}", event_data
+    
+    def batch_natural_language_to_ics(
+        self,
+        user_inputs: List[str]
+    ) -> List[Tuple[Optional[bytes], Optional[str], Optional[Dict[str, Any]]]]:
+        """
+        Parse several natural language requests with a single LLM call
+        
+        All inputs are sent as one numbered list and the model returns a JSON
+        array, so N events cost one round trip instead of N.
+        
+        Args:
+            user_inputs: Natural language event descriptions
+            
+        Returns:
+            List with one (ics_content, error, parsed_data) tuple per input,
+            in input order, following natural_language_to_ics() conventions
+        
+        Example:
+            >>> skill = CalendarAssistantSkill(api_key="your_key")
+            >>> results = skill.batch_natural_language_to_ics([
+            ...     "Team standup tomorrow at 9am for 15 minutes",
+            ...     "Dentist appointment Friday at 10:30am"
+            ... ])
+            >>> for ics, error, data in results:
+            ...     print(error or data['summary'])
+        """
+        if not user_inputs:
+            return []
+        
+        if not self.llm:
+            error = "LLM not initialized. Please provide API key and ensure langchain packages are installed."
+            return [(None, error, None)] * len(user_inputs)
+        
+        try:
+            from langchain_core.messages import SystemMessage, HumanMessage
+            current_date = datetime.now(self._tz).strftime("%Y-%m-%d")
+            
+            messages = [
+                SystemMessage(content=self._build_batch_system_prompt()),
+                HumanMessage(content=self._build_batch_user_message(user_inputs, current_date))
+            ]
+            
+            # One event object per input; "max_tokens" is the payload key
+            # ChatNVIDIA sends, so it overrides the per-instance ceiling.
+            response = self.llm.invoke(
+                messages, max_tokens=_LLM_MAX_TOKENS * len(user_inputs)
+            )
+            response_text = self._extract_json_text(response.content)
+            
+            events = _json_loads(response_text.encode('utf-8'))
+        except json.JSONDecodeError as e:
+            return [(None, f"Error parsing JSON response: {str(e)}", None)] * len(user_inputs)
+        except Exception as e:
+            return [(None, f"Error parsing with AI: {str(e)}", None)] * len(user_inputs)
+        
+        if not isinstance(events, list) or len(events) != len(user_inputs):
+            error = f"Expected a JSON array of {len(user_inputs)} events"
+            return [(None, error, None)] * len(user_inputs)
+        
+        # One DTSTAMP for the whole batch
+        now = datetime.now(self._utc)
+        results = []
+        for event_data in events:
+            error = self._validate_event_data(event_data)
+            if error:
+                results.append((None, error, None))
+                continue
+            
+            try:
+                ics_content = self.create_event_from_data(event_data, dtstamp=now)
+                results.append((ics_content, None, event_data))
+            except Exception as e:
+                results.append((None, f"Error creating ICS: {str(e)}", event_data))
+        
+        return results
+    
+    def _build_system_prompt(self) -> str:
         """
         Build the system prompt with Agent Skills awareness
         
         According to https://agentskills.io/integrate-skills, agents should have
         skill metadata injected into their system prompt for skill discovery.
         
-        Args:
-            current_date: Current date string for reference
-            
+        The prompt contains no per-call values, so it is only rebuilt when the
+        skills XML changes and is otherwise identical across requests.
+        
         Returns:
             System prompt with optional skill metadata injection
         """
         # Get available skills metadata
         available_skills_xml = self._get_available_skills_xml()
         
-        base_prompt = f"""You are a calendar assistant. Parse user requests into structured event data.
-Return ONLY a valid JSON object with these fields:
-{{
-    "summary": "Event title",
-    "description": "Event description",
-    "start_date": "YYYY-MM-DD",
-    "start_time": "HH:MM",
-    "duration_hours": float,
-    "location": "Location (optional)",
-    "organizer_email": "email@example.com (optional)",
-    "organizer_name": "Name (optional)",
-    "reminder_hours": 1
-}}
+        if self._system_prompt is None or available_skills_xml is not self._system_prompt_xml:
+            # Inject available skills metadata if running in agent context
+            if available_skills_xml:
+                self._system_prompt = f"""{_SYSTEM_PROMPT_STATIC}
 
-Current date for reference: {current_date}
-Timezone: {self.default_timezone}
+{available_skills_xml}"""
+            else:
+                self._system_prompt = _SYSTEM_PROMPT_STATIC
+            self._system_prompt_xml = available_skills_xml
+        
+        return self._system_prompt
+    
+    def _build_batch_system_prompt(self) -> str:
+        """Extend the system prompt with instructions for numbered multi-event requests"""
+        return f"""{self._build_system_prompt()}
 
-Example input: "Schedule a team meeting tomorrow at 2pm for 2 hours about Q4 planning"
-Example output: {{"summary": "Team Meeting - Q4 Planning", "start_date": "2026-01-13", "start_time": "14:00", "duration_hours": 2.0, "description": "Quarterly planning discussion", "reminder_hours": 1}}
+BATCH MODE: The request lists several numbered event descriptions. Return ONLY a JSON array containing one event object per numbered description, in the same order."""
+    
+    def _build_batch_user_message(self, user_inputs: List[str], current_date: str) -> str:
+        """Build the user message for batch parsing with numbered requests"""
+        numbered = "\n".join(f"{i}. {text}" for i, text in enumerate(user_inputs, 1))
+        return f"""Current date: {current_date}
+Timezone: {self.default_timezone}
 
-IMPORTANT: Return ONLY the JSON object, no explanations."""
+Requests:
+{numbered}"""
+    
+    def _build_user_message(self, user_input: str, current_date: str) -> str:
+        """
+        Build the user message carrying the per-call date context
         
-        # Inject available skills metadata if running in agent context
-        if available_skills_xml:
-            return f"""{base_prompt}
+        Args:
+            user_input: Natural language description of the event
+            current_date: Current date string for reference
+            
+        Returns:
+            User message content
+        """
+        return f"""Current date: {current_date}
+Timezone: {self.default_timezone}
 
-{available_skills_xml}"""
-        
-        return base_prompt
+Request: {user_input}"""
     
     def _get_available_skills_xml(self) -> str:
         """
@@ -462,36 +1386,43 @@ IMPORTANT: Return ONLY the JSON object, no explanations."""
         This follows the Agent Skills specification:
         https://agentskills.io/integrate-skills#injecting-into-context
         
+        The rendered block is cached and only rebuilt when SKILL.md changes.
+        
         Returns:
             XML string with skill metadata, or empty string if SKILL.md not found
         """
-        if not self.skill_location.exists():
+        try:
+            mtime = os.stat(self.skill_location).st_mtime_ns
+        except OSError:
             return ""
         
+        if self._skills_xml_cache is None or mtime != self._skills_xml_mtime:
+            self._skills_xml_cache = self._render_available_skills_xml()
+            self._skills_xml_mtime = mtime
+        
+        return self._skills_xml_cache
+    
+    def _render_available_skills_xml(self) -> str:
+        """Parse SKILL.md frontmatter and render the <available_skills> block"""
         # Parse SKILL.md frontmatter
         try:
-            with open(self.skill_location, 'r', encoding='utf-8') as f:
-                content = f.read()
+            frontmatter_text = _read_frontmatter(self.skill_location)
             
-            # Extract frontmatter
-            if content.startswith("---"):
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    try:
-                        import yaml
-                        frontmatter = yaml.safe_load(parts[1])
-                        name = frontmatter.get('name', 'calendar-assistant')
-                        description = frontmatter.get('description', 'Calendar management skill')
-                        
-                        return f"""<available_skills>
+            if frontmatter_text is not None:
+                try:
+                    frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
+                    name = frontmatter.get('name', 'calendar-assistant')
+                    description = frontmatter.get('description', 'Calendar management skill')
+                    
+                    return f"""<available_skills>
   <skill>
-    <name>{name}</name>
-    <description>{description}</description>
-    <location>{self.skill_location.absolute()}</location>
+    <name>{_xml_escape(str(name))}</name>
+    <description>{_xml_escape(str(description))}</description>
+    <location>{_xml_escape(self._skill_location_abs)}</location>
   </skill>
 </available_skills>"""
-                    except:
-                        pass
+                except:
+                    pass
         except:
             pass
         
@@ -500,10 +1431,30 @@ IMPORTANT: Return ONLY the JSON object, no explanations."""
   <skill>
     <name>calendar-assistant</name>
     <description>A comprehensive calendar management skill that enables AI agents to create, parse, and manage calendar events using natural language or structured inputs.</description>
-    <location>{self.skill_location.absolute()}</location>
+    <location>{_xml_escape(self._skill_location_abs)}</location>
   </skill>
 </available_skills>"""
     
+    def prewarm(self) -> bool:
+        """
+        Do the one-time LLM setup before the first request arrives
+        
+        Binding the event schema queries the endpoint's model list, which
+        otherwise adds a network round-trip to the first parse. Safe to call
+        without an API key or network access.
+        
+        Returns:
+            True if schema-constrained parsing is ready
+        
+        Example:
+            >>> skill = CalendarAssistantSkill(api_key="nvapi-...")
+            >>> skill.prewarm()
+            True
+        """
+        if not self.llm:
+            return False
+        return self._get_structured_llm() is not None
+    
     def get_skill_info(self) -> Dict[str, Any]:
         """
         Get information about this skill's capabilities and status
@@ -540,10 +1491,31 @@ IMPORTANT: Return ONLY the JSON object, no explanations."""
             "llm_available": self.llm is not None,
             "langchain_available": LANGCHAIN_AVAILABLE,
             "default_timezone": self.default_timezone,
-            "skill_location": str(self.skill_location.absolute()) if self.skill_location.exists() else "not found"
+            "skill_location": self._skill_location_abs if self.skill_location.exists() else "not found"
         }
 
 
+def _iter_skill_md_files(root: str) -> Iterator[str]:
+    """
+    Yield paths of all SKILL.md files below root
+    
+    Walks the tree with os.scandir so only matching files are turned into
+    paths; directory symlinks are not followed.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "SKILL.md":
+                        yield entry.path
+        except OSError:
+            continue
+
+
 # Skill discovery utility for agents
 def discover_skills(skill_directories: List[str]) -> List[Dict[str, str]]:
     """
@@ -563,38 +1535,44 @@ def discover_skills(skill_directories: List[str]) -> List[Dict[str, str]]:
     skills = []
     
     for directory in skill_directories:
-        dir_path = Path(directory)
-        if not dir_path.exists():
+        if not os.path.isdir(directory):
             continue
         
         # Find all SKILL.md files
-        for skill_md in dir_path.rglob("SKILL.md"):
+        for skill_md_path in _iter_skill_md_files(directory):
+            skill_md = Path(skill_md_path)
             try:
-                with open(skill_md, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                frontmatter_text = _read_frontmatter(skill_md)
                 
-                # Extract frontmatter
-                if content.startswith("---"):
-                    parts = content.split("---", 2)
-                    if len(parts) >= 3:
-                        try:
-                            import yaml
-                            frontmatter = yaml.safe_load(parts[1])
-                            
-                            skills.append({
-                                "name": frontmatter.get('name', 'unknown'),
-                                "description": frontmatter.get('description', ''),
-                                "location": str(skill_md.absolute()),
-                                "path": str(skill_md.parent)
-                            })
-                        except:
-                            pass
+                if frontmatter_text is not None:
+                    try:
+                        frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
+                        
+                        skills.append({
+                            "name": frontmatter.get('name', 'unknown'),
+                            "description": frontmatter.get('description', ''),
+                            "location": str(skill_md.absolute()),
+                            "path": str(skill_md.parent)
+                        })
+                    except:
+                        pass
             except:
                 continue
     
     return skills
 
 
+@functools.lru_cache(maxsize=32)
+def _discover_skills_cached(root: str, mtime_ns: int) -> Tuple[Dict[str, str], ...]:
+    """
+    Memoized discover_skills() for a single root directory
+    
+    Callers pass os.stat(root).st_mtime_ns so the entry is invalidated when
+    skills are added to or removed from the directory.
+    """
+    return tuple(discover_skills([root]))
+
+
 def generate_skills_xml(skills: List[Dict[str, str]]) -> str:
     """
     Generate XML for injecting into agent system prompt
@@ -610,35 +1588,52 @@ def generate_skills_xml(skills: List[Dict[str, str]]) -> str:
     if not skills:
         return ""
     
-    xml_parts = ["<available_skills>"]
-    
-    for skill in skills:
-        xml_parts.append(f"""  <skill>
-    <name>{skill['name']}</name>
-    <description>{skill['description']}</description>
-    <location>{skill['location']}</location>
-  </skill>""")
-    
-    xml_parts.append("</available_skills>")
-    
-    return "\n".join(xml_parts)
+    key = tuple(
+        (str(skill['name']), str(skill['description']), str(skill['location']))
+        for skill in skills
+    )
+    return _generate_skills_xml_cached(key)
+
+
+@functools.lru_cache(maxsize=32)
+def _generate_skills_xml_cached(skills: Tuple[Tuple[str, str, str], ...]) -> str:
+    """Render the <available_skills> block for a tuple of (name, description, location)"""
+    return "".join(_iter_skills_xml_fragments(skills))
+
+
+def _iter_skills_xml_fragments(skills: Tuple[Tuple[str, str, str], ...]) -> Iterator[str]:
+    """Yield the <available_skills> XML as constant tags and escaped field values"""
+    yield "<available_skills>"
+    for name, description, location in skills:
+        yield "\n  <skill>\n    <name>"
+        yield _xml_escape(name)
+        yield "</name>\n    <description>"
+        yield _xml_escape(description)
+        yield "</description>\n    <location>"
+        yield _xml_escape(location)
+        yield "</location>\n  </skill>"
+    yield "\n</available_skills>"
+
+
+# Static skill metadata, exposed read-only so the shared object can't be mutated
+_SKILL_METADATA = MappingProxyType({
+    "name": "calendar-assistant",
+    "version": "1.0.0",
+    "description": "Calendar management skill for creating events from natural language",
+    "runtime": "python",
+    "entry_point": "calendar_skill.py"
+})
 
 
 # Convenience functions for skill discovery
-def get_skill_metadata() -> Dict[str, Any]:
+def get_skill_metadata() -> Mapping[str, Any]:
     """
     Get skill metadata without initialization
     
     Returns:
-        Dict with basic skill information
+        Read-only mapping with basic skill information
     """
-    return {
-        "name": "calendar-assistant",
-        "version": "1.0.0",
-        "description": "Calendar management skill for creating events from natural language",
-        "runtime": "python",
-        "entry_point": "calendar_skill.py"
-    }
+    return _SKILL_METADATA
 
 
 def create_skill_instance(api_key: Optional[str] = None, **kwargs) -> CalendarAssistantSkill:
@@ -660,16 +1655,74 @@ def create_skill_instance(api_key: Optional[str] = None, **kwargs) -> CalendarAs
 # These @skill_tool decorated functions are auto-discovered by the skill loader
 # ============================================================================
 
-# Global skill instance for tool functions
-_global_skill_instance = None
+@functools.cache
+def _get_skill_instance() -> CalendarAssistantSkill:
+    """Get or create the shared skill instance used by the tool functions"""
+    return CalendarAssistantSkill(api_key=os.getenv("NVIDIA_API_KEY"))
 
-def _get_skill_instance():
-    """Get or create the global skill instance"""
-    global _global_skill_instance
-    if _global_skill_instance is None:
-        api_key = os.getenv("NVIDIA_API_KEY")
-        _global_skill_instance = CalendarAssistantSkill(api_key=api_key)
-    return _global_skill_instance
+
+class _SafeFilenameTable(dict):
+    """str.translate table: keep alphanumerics and '_', map ' ' to '_', drop the rest"""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Non-ASCII codepoints are resolved on first sight and memoized
+        value = codepoint if chr(codepoint).isalnum() else None
+        self[codepoint] = value
+        return value
+
+
+# ASCII characters kept in generated filenames (' ' is then mapped to '_')
+_ALLOWED_FN_CHARS = frozenset(string.ascii_letters + string.digits + ' _')
+
+_SAFE_FN_TABLE = _SafeFilenameTable(
+    (i, i if chr(i) in _ALLOWED_FN_CHARS else None) for i in range(128)
+)
+_SAFE_FN_TABLE[ord(' ')] = ord('_')
+
+
+def _sanitize_summary(summary: str) -> str:
+    """Turn an event summary into a filesystem-safe filename stem"""
+    return summary.translate(_SAFE_FN_TABLE)[:50].strip('_')
+
+
+# Default ICS filename patterns
+_SUMMARY_TEMPLATE = "%s_%s.ics"
+_EVENT_TEMPLATE = "event_%d.ics"
+
+
+def _ensure_ics_name(
+    name: Optional[str],
+    summary: Optional[str],
+    start_date: Optional[str]
+) -> str:
+    """
+    Resolve the output filename for an ICS file
+    
+    A user-supplied name gets '.ics' appended if missing; otherwise the name
+    is built from the summary and start date, or a nanosecond timestamp
+    when neither is known.
+    """
+    if name:
+        return name if name.endswith('.ics') else name + '.ics'
+    if summary is not None:
+        return _SUMMARY_TEMPLATE % (_sanitize_summary(summary), start_date)
+    return _EVENT_TEMPLATE % time.time_ns()
+
+
+# O_BINARY only exists (and matters) on Windows: without it os.open uses text
+# mode there and every CRLF in the ICS payload is written as CR CR LF
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes_fast(path: str, data: bytes) -> None:
+    """Write a small payload with raw os.open/os.write, bypassing the io stack"""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 @skill_tool(
@@ -701,8 +1754,8 @@ def parse_calendar_event(
     ref_dt = None
     if reference_date:
         try:
-            ref_dt = datetime.strptime(reference_date, '%Y-%m-%d')
-            ref_dt = ref_dt.replace(tzinfo=zoneinfo.ZoneInfo(skill.default_timezone))
+            ref_dt = _parse_iso_date(reference_date)
+            ref_dt = ref_dt.replace(tzinfo=skill._tz)
         except ValueError:
             return {"error": f"Invalid reference_date format: {reference_date}. Use YYYY-MM-DD"}
     
@@ -751,13 +1804,24 @@ def create_ics_file(
     """
     skill = _get_skill_instance()
     
+    if not summary:
+        return {"error": "Event summary is required"}
+    
+    # Parse date and time
+    try:
+        m = _EVENT_RE.match(f"{start_date}T{start_time}")
+        if m and m.group(4) is not None:
+            year, month, day, hour, minute = map(int, m.groups())
+            event_date = datetime(year, month, day, hour, minute, tzinfo=skill._tz)
+        else:
+            # Non-canonical input such as "9:30"
+            event_date = _parse_iso_date(start_date)
+            hour, minute = _parse_hhmm(start_time)
+            event_date = event_date.replace(hour=hour, minute=minute, tzinfo=skill._tz)
+    except (ValueError, TypeError) as e:
+        return {"error": f"Invalid date/time format: {str(e)}"}
+    
     try:
-        # Parse date and time
-        event_date = datetime.strptime(start_date, '%Y-%m-%d')
-        hour, minute = map(int, start_time.split(':'))
-        event_date = event_date.replace(hour=hour, minute=minute)
-        event_date = event_date.replace(tzinfo=zoneinfo.ZoneInfo(skill.default_timezone))
-        
         # Create ICS content
         ics_content = skill.create_calendar_event(
             summary=summary,
@@ -768,30 +1832,19 @@ def create_ics_file(
             reminder_hours=reminder_hours
         )
         
-        # Determine output filename
-        if not output_filename:
-            safe_summary = "".join(c for c in summary if c.isalnum() or c in (' ', '_')).strip()
-            safe_summary = safe_summary.replace(' ', '_')[:50]
-            output_filename = f"{safe_summary}_{start_date}.ics"
-        
-        # Ensure .ics extension
-        if not output_filename.endswith('.ics'):
-            output_filename += '.ics'
+        output_filename = _ensure_ics_name(output_filename, summary, start_date)
         
         # Save file
-        output_path = Path(output_filename)
-        output_path.write_bytes(ics_content)
+        _write_bytes_fast(output_filename, ics_content)
         
         return {
             "success": True,
-            "file_path": str(output_path.absolute()),
+            "file_path": os.path.abspath(output_filename),
             "file_size": len(ics_content),
             "event_summary": summary,
             "start_datetime": f"{start_date} {start_time}"
         }
         
-    except ValueError as e:
-        return {"error": f"Invalid date/time format: {str(e)}"}
     except Exception as e:
         return {"error": f"Error creating ICS file: {str(e)}"}
 
@@ -819,39 +1872,91 @@ def natural_language_to_calendar(
         >>> natural_language_to_calendar("Schedule team meeting tomorrow at 2pm for 2 hours")
         >>> natural_language_to_calendar("Dentist appointment Friday at 10:30am", "dentist.ics")
     """
-    skill = _get_skill_instance()
+    ics_content, error, parsed_data = _get_skill_instance().natural_language_to_ics(user_input)
+    return _save_calendar_result(ics_content, error, parsed_data, output_filename)
+
+
+@skill_tool(
+    name="natural_language_to_calendar_batch",
+    description="Create several ICS files at once from a list of natural language event descriptions. Use when the user describes multiple events.",
+    return_direct=False
+)
+def natural_language_to_calendar_batch(inputs: List[str]) -> List[Dict[str, Any]]:
+    """
+    Parse several natural language requests and create one ICS file each
     
-    # Parse natural language
-    ics_content, error, parsed_data = skill.natural_language_to_ics(user_input)
+    Requests are parsed concurrently; the LLM calls are network-bound, so
+    threads overlap their latency. Files are then written in input order,
+    and events that would share a filename (same title and date) get a
+    numeric suffix instead of overwriting each other.
+    
+    Args:
+        inputs: List of natural language event descriptions
+    
+    Returns:
+        List of result dictionaries, in input order, as returned by
+        natural_language_to_calendar()
     
+    Examples:
+        >>> natural_language_to_calendar_batch([
+        ...     "Team standup tomorrow at 9am for 15 minutes",
+        ...     "Dentist appointment Friday at 10:30am"
+        ... ])
+    """
+    if not inputs:
+        return []
+    
+    skill = _get_skill_instance()
+    with ThreadPoolExecutor(max_workers=min(16, len(inputs))) as executor:
+        outcomes = list(executor.map(skill.natural_language_to_ics, inputs))
+    
+    used_names: Set[str] = set()
+    return [
+        _save_calendar_result(ics_content, error, parsed_data, used_names=used_names)
+        for ics_content, error, parsed_data in outcomes
+    ]
+
+
+def _unique_ics_name(name: str, used_names: Set[str]) -> str:
+    """Return name, suffixed _2, _3, ... if it is already in used_names, and record it"""
+    candidate = name
+    suffix = 1
+    while candidate in used_names:
+        suffix += 1
+        candidate = "%s_%d.ics" % (name[:-4], suffix)
+    used_names.add(candidate)
+    return candidate
+
+
+def _save_calendar_result(
+    ics_content: Optional[bytes],
+    error: Optional[str],
+    parsed_data: Optional[Dict[str, Any]],
+    output_filename: Optional[str] = None,
+    used_names: Optional[Set[str]] = None
+) -> Dict[str, Any]:
+    """Save one natural_language_to_ics() outcome (shared by the single and batch tools)"""
     if error:
         return {"error": error}
     
     try:
-        # Determine output filename
-        if not output_filename and parsed_data:
-            summary = parsed_data.get('summary', 'event')
-            safe_summary = "".join(c for c in summary if c.isalnum() or c in (' ', '_')).strip()
-            safe_summary = safe_summary.replace(' ', '_')[:50]
-            start_date = parsed_data.get('start_date', 'unknown')
-            output_filename = f"{safe_summary}_{start_date}.ics"
-        elif not output_filename:
-            output_filename = f"event_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ics"
-        
-        # Ensure .ics extension
-        if not output_filename.endswith('.ics'):
-            output_filename += '.ics'
+        output_filename = _ensure_ics_name(
+            output_filename,
+            parsed_data.get('summary', 'event'),
+            parsed_data.get('start_date', 'unknown')
+        )
+        if used_names is not None:
+            output_filename = _unique_ics_name(output_filename, used_names)
         
         # Save file
-        output_path = Path(output_filename)
-        output_path.write_bytes(ics_content)
+        _write_bytes_fast(output_filename, ics_content)
         
         return {
             "success": True,
-            "file_path": str(output_path.absolute()),
+            "file_path": os.path.abspath(output_filename),
             "file_size": len(ics_content),
             "parsed_data": parsed_data,
-            "message": f"✅ Calendar event created: {output_path.name}"
+            "message": f"✅ Calendar event created: {os.path.basename(output_filename)}"
         }
         
     except Exception as e:
@@ -874,92 +1979,26 @@ def get_calendar_skill_info() -> Dict[str, Any]:
     return skill.get_skill_info()
 
 
-# Example usage function for testing
-def example_usage():
-    """Example of how to use the Calendar Assistant Skill"""
-    
-    print("\n" + "="*60)
-    print("Calendar Assistant Skill - Agent Skills API Compliant")
-    print("="*60 + "\n")
-    
-    # Demonstrate skill discovery
-    print("🔍 Discovering skills...")
-    current_dir = Path(__file__).parent.parent
-    skills = discover_skills([str(current_dir)])
-    
-    if skills:
-        print(f"✅ Found {len(skills)} skill(s):\n")
-        for skill in skills:
-            print(f"  - {skill['name']}: {skill['description'][:80]}...")
-            print(f"    Location: {skill['location']}\n")
-        
-        print("📝 Generated XML for agent prompt:")
-        print(generate_skills_xml(skills))
-        print()
-    
-    print("="*60 + "\n")
-    
-    # Check for API key
-    api_key = os.getenv("NVIDIA_API_KEY")
-    if not api_key:
-        print("⚠️  Note: NVIDIA_API_KEY environment variable not set")
-        print("   Natural language parsing will be unavailable\n")
+@skill_tool(
+    name="get_calendar_skill_info_json",
+    description="Get information about the calendar skill capabilities and status as a JSON string",
+    return_direct=False
+)
+def get_calendar_skill_info_json() -> str:
+    """
+    Get metadata about the calendar assistant skill, pre-serialized as JSON
     
-    # Initialize skill
-    try:
-        skill = CalendarAssistantSkill(api_key=api_key, default_timezone="UTC")
-        print("✅ Skill initialized successfully\n")
-        
-        # Show skill info
-        info = skill.get_skill_info()
-        print("📊 Skill Information:")
-        print(json.dumps(info, indent=2))
-        print("\n" + "="*60 + "\n")
-        
-        # Example 1: Create event manually
-        print("🧪 Testing manual event creation...")
-        start_time = datetime.now(zoneinfo.ZoneInfo("UTC")) + timedelta(days=1, hours=14)
-        ics_content = skill.create_calendar_event(
-            summary="Team Standup Meeting",
-            start_datetime=start_time,
-            duration_hours=0.5,
-            description="Daily team synchronization",
-            location="Conference Room A",
-            reminder_hours=1.0
-        )
-        print(f"✅ Created ICS file ({len(ics_content)} bytes)")
-        print("   Event: Team Standup Meeting")
-        print(f"   Start: {start_time.strftime('%Y-%m-%d %H:%M %Z')}")
-        print(f"   Duration: 30 minutes\n")
-        
-        # Example 2: Natural language parsing
-        if api_key:
-            print("🧪 Testing natural language parsing...")
-            ics_content, error, parsed_data = skill.natural_language_to_ics(
-                "Schedule a client presentation tomorrow at 2pm for 2 hours"
-            )
-            if error:
-                print(f"❌ Error: {error}")
-            else:
-                print("✅ Successfully parsed and created event:")
-                print(f"   {json.dumps(parsed_data, indent=3)}")
-                print(f"✅ Created ICS file ({len(ics_content)} bytes)\n")
-        else:
-            print("⚠️  Skipping natural language test (no API key)")
-            print("   Set NVIDIA_API_KEY to test this feature\n")
-        
-        print("="*60 + "\n")
-        print("✅ All tests completed successfully!")
-        print("\n" + "="*60 + "\n")
-        
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
-        exit(1)
-
-
+    Returns:
+        JSON string with the same content as get_calendar_skill_info()
+    """
+    return _json_dumps(get_calendar_skill_info())
 
 
 # Main execution for testing
 if __name__ == "__main__":
+    try:
+        from ._demo import example_usage
+    except ImportError:
+        # Run as a plain script rather than as part of the package
+        from _demo import example_usage
     example_usage()
-
@@ -8,12 +8,16 @@ Now using skill_loader.py for OpenSkills + AI Planner integration
 import os
 import sys
 import re
+import time
+import asyncio
 import gradio as gr
 from pathlib import Path
 from typing import List, Optional, Tuple
-from openai import OpenAI
+from openai import AsyncOpenAI
 from datetime import datetime
 import tempfile
+import importlib.util
+import httpx
 
 # Import the new SkillLoader infrastructure
 from skill_loader import SkillLoader
@@ -25,6 +29,15 @@ from calendar_skill import CalendarAssistantSkill
 sys.path.insert(0, str(Path(__file__).parent / 'nvidia_ideagen_skill' / 'scripts'))
 from ideagen_skill import NvidiaIdeaGenSkill
 
+# HTTP/2 for the NVIDIA API needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Patterns used on every request, compiled once
+_NUM_IDEAS_RE = re.compile(r'(\d+)\s+ideas?')
+_STRIP_VERBS_RE = re.compile(r'generate|brainstorm|give me|create|come up with|i need', re.IGNORECASE)
+_STRIP_COUNT_RE = re.compile(r'\d+\s+ideas?\s+(for|about|on)?', re.IGNORECASE)
+_ICS_SUMMARY_RE = re.compile(r'SUMMARY:(.*?)(?:\r?\n)')
+
 
 class AgentSkillsChatbot:
     """
@@ -40,6 +53,19 @@ class AgentSkillsChatbot:
     Reference: https://agentskills.io/integrate-skills#overview
     """
     
+    # Step 3 trigger keywords for each skill
+    SKILL_TRIGGERS = {
+        'calendar-assistant': (
+            'calendar', 'meeting', 'appointment', 'schedule', 'event',
+            'book', 'create event', 'add to calendar', 'set up meeting',
+            'remind', 'deadline'
+        ),
+        'nvidia-ideagen': (
+            'idea', 'brainstorm', 'generate ideas', 'creative', 'concept',
+            'ideation', 'innovation', 'suggest', 'come up with', 'think of'
+        )
+    }
+    
     def __init__(self, skills_base_path: str, api_key: Optional[str] = None):
         """
         Initialize chatbot with SkillLoader
@@ -62,46 +88,95 @@ class AgentSkillsChatbot:
         
         # STEP 2: Load metadata (name and description) at startup
         print(f"📋 Step 2: Loading metadata at startup")
-        self.skills = self.skill_loader.list_skills()
+        self._index_skills()
         print(f"✅ Discovered {len(self.skills)} skill(s):")
         for skill in self.skills:
             print(f"   📦 {skill.name} - {skill.skill_type}")
             print(f"      {skill.description[:80]}...")
         
-        # Initialize OpenAI client with NVIDIA endpoint
-        self.client = OpenAI(
+        # Initialize async OpenAI client with NVIDIA endpoint; its pooled
+        # keep-alive connections are shared by every chat session and skill
+        self.client = AsyncOpenAI(
             base_url="https://integrate.api.nvidia.com/v1",
-            api_key=self.api_key
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
         )
         self.model = "nvidia/llama-3.1-nemotron-nano-8b-v1"
         
-        # Initialize skill instances for direct execution (Step 5 preparation)
-        self._init_skill_instances()
+        # Skill instances for direct execution (Step 5) are created on first
+        # use, so a session only pays for the skills it actually runs
+        self._skill_instances = {}
+        
+        # Step 5 output flow for each skill, see chat_stream
+        self._executors = {
+            'calendar-assistant': self._run_calendar_flow,
+            'nvidia-ideagen': self._run_ideagen_flow
+        }
     
-    def _init_skill_instances(self):
-        """Initialize skill instances for direct execution"""
-        # Calendar skill
-        try:
-            self.calendar_skill = CalendarAssistantSkill(api_key=self.api_key)
-            print("✅ Calendar skill initialized for execution")
-        except Exception as e:
-            print(f"⚠️  Calendar skill initialization failed: {e}")
-            self.calendar_skill = None
+    def _index_skills(self):
+        """Cache the discovered skills and everything derived from them"""
+        self.skills = self.skill_loader.list_skills()
         
-        # IdeaGen skill
-        try:
-            self.ideagen_skill = NvidiaIdeaGenSkill(api_key=self.api_key)
-            print("✅ IdeaGen skill initialized for execution")
-        except Exception as e:
-            print(f"⚠️  IdeaGen skill initialization failed: {e}")
-            self.ideagen_skill = None
+        # Skill metadata is fixed after Step 2, so render the summaries shown
+        # on every query and in the UI once instead of per request
+        self.skills_details = f'Found {len(self.skills)} skills: {", ".join(s.name for s in self.skills)}'
+        self.skills_markdown = "".join(
+            f"- **{skill.name}** ({skill.skill_type})\n  - {skill.description}\n"
+            for skill in self.skills
+        )
+        
+        # Step 3 keyword table: (keyword, skill name) for every discovered
+        # skill with triggers, in discovery order so ties resolve as before
+        self._trigger_table = tuple(
+            (kw, skill.name)
+            for skill in self.skills
+            for kw in self.SKILL_TRIGGERS.get(skill.name, ())
+        )
+        
+        # System prompt bodies keyed by activated skill, see build_system_prompt
+        self._static_prompts = {}
+    
+    def reload_skills(self):
+        """Re-run skill discovery and drop everything cached from the old skills"""
+        self.skill_loader.discover_skills()
+        self._index_skills()
+    
+    @property
+    def calendar_skill(self) -> Optional[CalendarAssistantSkill]:
+        """Calendar skill instance, or None if it failed to initialize"""
+        return self._get_skill_instance("Calendar", CalendarAssistantSkill)
+    
+    @property
+    def ideagen_skill(self) -> Optional[NvidiaIdeaGenSkill]:
+        """IdeaGen skill instance, or None if it failed to initialize"""
+        return self._get_skill_instance("IdeaGen", NvidiaIdeaGenSkill, async_client=self.client)
+    
+    def _get_skill_instance(self, label: str, skill_class: type, **kwargs):
+        """Create a skill instance on first access; failures are remembered"""
+        if label not in self._skill_instances:
+            try:
+                instance = skill_class(api_key=self.api_key, **kwargs)
+                print(f"✅ {label} skill initialized for execution")
+            except Exception as e:
+                print(f"⚠️  {label} skill initialization failed: {e}")
+                instance = None
+            self._skill_instances[label] = instance
+        return self._skill_instances[label]
     
     # ========================================================================
     # STEP 3: Match user tasks to relevant skills
     # Reference: https://agentskills.io/integrate-skills#overview
     # ========================================================================
     
-    def step3_match_skill(self, user_query: str) -> Tuple[Optional[str], dict]:
+    def step3_match_skill(
+        self, 
+        user_query: str, 
+        query_lower: Optional[str] = None
+    ) -> Tuple[Optional[str], dict]:
         """
         STEP 3: Match user task to relevant skill
         
@@ -110,48 +185,35 @@ class AgentSkillsChatbot:
         
         Args:
             user_query: User's question or request
+            query_lower: user_query.lower(), if the caller already has it
             
         Returns:
             Tuple of (skill_name, match_info_dict)
             match_info includes: score, matched_keywords, reasoning
         """
-        query_lower = user_query.lower()
-        
-        # Define trigger keywords for each skill
-        triggers = {
-            'calendar-assistant': [
-                'calendar', 'meeting', 'appointment', 'schedule', 'event',
-                'book', 'create event', 'add to calendar', 'set up meeting',
-                'remind', 'deadline'
-            ],
-            'nvidia-ideagen': [
-                'idea', 'brainstorm', 'generate ideas', 'creative', 'concept',
-                'ideation', 'innovation', 'suggest', 'come up with', 'think of'
-            ]
-        }
-        
-        # Score each discovered skill based on trigger keyword matches
-        skill_scores = {}
-        skill_matches = {}
-        
-        for skill in self.skills:
-            if skill.name in triggers:
-                keywords = triggers[skill.name]
-                matched_kw = [kw for kw in keywords if kw in query_lower]
-                score = len(matched_kw)
-                
-                if score > 0:
-                    skill_scores[skill.name] = score
-                    skill_matches[skill.name] = {
-                        'score': score,
-                        'matched_keywords': matched_kw,
-                        'description': skill.description[:100]
-                    }
+        if query_lower is None:
+            query_lower = user_query.lower()
+        
+        # Score each discovered skill based on trigger keyword matches,
+        # tracking the leader as we go. The table is grouped by skill, so a
+        # later skill only takes over with a strictly higher score and ties
+        # go to the first discovered skill.
+        skill_keywords = {}
+        best_skill, best_score = None, 0
+        for kw, skill_name in self._trigger_table:
+            if kw in query_lower:
+                matched_kw = skill_keywords.setdefault(skill_name, [])
+                matched_kw.append(kw)
+                if len(matched_kw) > best_score:
+                    best_skill, best_score = skill_name, len(matched_kw)
         
         # Return skill with highest score
-        if skill_scores:
-            best_skill = max(skill_scores, key=skill_scores.get)
-            match_info = skill_matches[best_skill]
+        if best_skill:
+            match_info = {
+                'score': best_score,
+                'matched_keywords': skill_keywords[best_skill],
+                'description': self.skill_loader.get_skill(best_skill).description[:100]
+            }
             match_info['reasoning'] = f"Matched {match_info['score']} keyword(s): {', '.join(match_info['matched_keywords'][:3])}"
             return best_skill, match_info
         
@@ -191,8 +253,8 @@ class AgentSkillsChatbot:
             'instructions_loaded': bool(skill.skill_md_content),
             'content_length': len(skill.skill_md_content) if skill.skill_md_content else 0,
             'has_config': bool(skill.config),
-            'has_references': (skill.skill_path / 'references').exists(),
-            'has_assets': (skill.skill_path / 'assets').exists()
+            'has_references': skill.has_references,
+            'has_assets': skill.has_assets
         }
         
         # Check for tools
@@ -216,6 +278,9 @@ class AgentSkillsChatbot:
         Returns:
             Complete system prompt string
         """
+        # Read the clock once so date and time always agree
+        now = datetime.now()
+        
         # Base system prompt
         base_prompt = f"""You are an intelligent AI assistant with access to specialized skills.
 
@@ -225,14 +290,27 @@ When responding to user queries:
 3. Use the skill's capabilities to provide accurate, helpful responses
 4. If no skill matches, respond normally using your general knowledge
 
-Current date: {datetime.now().strftime("%Y-%m-%d")}
-Current time: {datetime.now().strftime("%H:%M:%S")}
+Current date: {now:%Y-%m-%d}
+Current time: {now:%H:%M:%S}
 
 """
         
+        return base_prompt + self._static_prompt_for_skill(activated_skill)
+    
+    def _static_prompt_for_skill(self, activated_skill: Optional[str]) -> str:
+        """
+        Skills XML plus the activated skill's instructions, cached per skill
+        
+        Everything after the date/time lines is fixed until skills are
+        reloaded, so it is only assembled once per activated skill.
+        """
+        cached = self._static_prompts.get(activated_skill)
+        if cached is not None:
+            return cached
+        
         # Add skills XML from SkillLoader
         skills_xml = self.skill_loader.generate_skills_xml()
-        prompt = base_prompt + skills_xml + "\n"
+        prompt = skills_xml + "\n"
         
         # If a skill is activated, add its full SKILL.md content
         if activated_skill:
@@ -244,6 +322,7 @@ Current time: {datetime.now().strftime("%H:%M:%S")}
                 prompt += "\n\n## End of Skill Instructions\n"
                 prompt += f"\nYou MUST follow the above skill instructions for this query.\n"
         
+        self._static_prompts[activated_skill] = prompt
         return prompt
     
     # ========================================================================
@@ -251,7 +330,7 @@ Current time: {datetime.now().strftime("%H:%M:%S")}
     # Reference: https://agentskills.io/integrate-skills#overview
     # ========================================================================
     
-    def step5_execute_calendar_skill(self, user_query: str) -> dict:
+    async def step5_execute_calendar_skill(self, user_query: str) -> dict:
         """
         STEP 5: Execute calendar skill scripts and access resources
         
@@ -275,7 +354,7 @@ Current time: {datetime.now().strftime("%H:%M:%S")}
         }
         
         try:
-            ics_content, error, parsed_data = self.calendar_skill.natural_language_to_ics(user_query)
+            ics_content, error, parsed_data = await self.calendar_skill.anatural_language_to_ics(user_query)
             
             if error:
                 execution_info['success'] = False
@@ -290,9 +369,9 @@ Current time: {datetime.now().strftime("%H:%M:%S")}
             # Check what resources were potentially accessed
             skill = self.skill_loader.get_skill('calendar-assistant')
             if skill:
-                if (skill.skill_path / 'references').exists():
+                if skill.has_references:
                     execution_info['resources_used'].append('references/ available')
-                if (skill.skill_path / 'assets').exists():
+                if skill.has_assets:
                     execution_info['resources_used'].append('assets/ available')
             
             return execution_info
@@ -302,13 +381,19 @@ Current time: {datetime.now().strftime("%H:%M:%S")}
             execution_info['error'] = str(e)
             return execution_info
     
-    def step5_execute_ideagen_skill(self, user_query: str, temperature: float):
+    async def step5_execute_ideagen_skill(
+        self, 
+        user_query: str, 
+        temperature: float, 
+        query_lower: Optional[str] = None
+    ):
         """
         STEP 5: Execute IdeaGen skill scripts with streaming
         
         Args:
             user_query: User's idea generation request
             temperature: Creativity level
+            query_lower: user_query.lower(), if the caller already has it
             
         Yields:
             Tuple of (chunk, execution_info)
@@ -326,12 +411,14 @@ Current time: {datetime.now().strftime("%H:%M:%S")}
         
         try:
             # Parse query to extract parameters
-            num_ideas_match = re.search(r'(\d+)\s+ideas?', user_query.lower())
+            if query_lower is None:
+                query_lower = user_query.lower()
+            num_ideas_match = _NUM_IDEAS_RE.search(query_lower)
             num_ideas = int(num_ideas_match.group(1)) if num_ideas_match and 1 <= int(num_ideas_match.group(1)) <= 10 else 5
             
             # Extract topic
-            topic = re.sub(r'generate|brainstorm|give me|create|come up with|i need', '', user_query, flags=re.IGNORECASE)
-            topic = re.sub(r'\d+\s+ideas?\s+(for|about|on)?', '', topic, flags=re.IGNORECASE)
+            topic = _STRIP_VERBS_RE.sub('', user_query)
+            topic = _STRIP_COUNT_RE.sub('', topic)
             topic = topic.strip() or user_query
             
             execution_info['parameters'] = {
@@ -343,13 +430,13 @@ Current time: {datetime.now().strftime("%H:%M:%S")}
             # Check what resources are available
             skill = self.skill_loader.get_skill('nvidia-ideagen')
             if skill:
-                if (skill.skill_path / 'references').exists():
+                if skill.has_references:
                     execution_info['resources_used'].append('references/ available')
-                if (skill.skill_path / 'assets').exists():
+                if skill.has_assets:
                     execution_info['resources_used'].append('assets/ available')
             
             # Stream ideas generation
-            for chunk in self.ideagen_skill.generate_ideas_stream(
+            async for chunk in self.ideagen_skill.agenerate_ideas_stream(
                 topic=topic,
                 num_ideas=num_ideas,
                 creativity=temperature
@@ -361,7 +448,7 @@ Current time: {datetime.now().strftime("%H:%M:%S")}
             execution_info['error'] = str(e)
             yield f"❌ Error executing idea generation skill: {str(e)}", execution_info
     
-    def chat_stream(
+    async def chat_stream(
         self, 
         user_query: str,
         temperature: float = 0.7,
@@ -393,7 +480,7 @@ Following the 5-step integration from [agentskills.io](https://agentskills.io/in
             'step': 1,
             'name': 'Discover & Load',
             'status': 'completed',
-            'details': f'Found {len(self.skills)} skills: {", ".join([s.name for s in self.skills])}'
+            'details': self.skills_details
         }
         yield f"**✅ Steps 1-2: Discover & Load Metadata** - {step_info['details']}\n\n", step_info, None
         
@@ -401,7 +488,9 @@ Following the 5-step integration from [agentskills.io](https://agentskills.io/in
         step_info = {'step': 3, 'name': 'Match', 'status': 'in_progress'}
         yield f"**⏳ Step 3: Matching Task to Skill** - Analyzing query...\n", step_info, None
         
-        matched_skill, match_info = self.step3_match_skill(user_query)
+        # Lowercase once for keyword matching and parameter extraction
+        query_lower = user_query.lower()
+        matched_skill, match_info = self.step3_match_skill(user_query, query_lower)
         
         if matched_skill:
             step_info['status'] = 'completed'
@@ -421,7 +510,7 @@ Following the 5-step integration from [agentskills.io](https://agentskills.io/in
             ]
             
             try:
-                completion = self.client.chat.completions.create(
+                completion = await self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,
                     temperature=temperature,
@@ -432,7 +521,7 @@ Following the 5-step integration from [agentskills.io](https://agentskills.io/in
                 
                 yield "**💬 Response:**\n\n", {'step': 'response'}, None
                 
-                for chunk in completion:
+                async for chunk in completion:
                     if chunk.choices[0].delta.content is not None:
                         yield chunk.choices[0].delta.content, {'step': 'response'}, None
             except Exception as e:
@@ -462,13 +551,25 @@ Following the 5-step integration from [agentskills.io](https://agentskills.io/in
         yield "---\n\n**📤 Skill Output:**\n\n", {'step': 'output'}, None
         
         # Execute based on skill type
-        if matched_skill == "calendar-assistant":
-            exec_info = self.step5_execute_calendar_skill(user_query)
-            
-            if exec_info['success']:
-                # Generate success message
-                parsed_data = exec_info['parsed_data']
-                success_msg = f"""✅ **Calendar Event Created!**
+        runner = self._executors.get(matched_skill)
+        if runner:
+            async for item in runner(user_query, query_lower, temperature, step_info):
+                yield item
+    
+    async def _run_calendar_flow(
+        self, 
+        user_query: str, 
+        query_lower: str, 
+        temperature: float, 
+        step_info: dict
+    ):
+        """Step 5 output for calendar-assistant: event summary plus ICS bytes"""
+        exec_info = await self.step5_execute_calendar_skill(user_query)
+        
+        if exec_info['success']:
+            # Generate success message
+            parsed_data = exec_info['parsed_data']
+            success_msg = f"""✅ **Calendar Event Created!**
 
 📅 **Event Details:**
 - **Title:** {parsed_data['summary']}
@@ -484,26 +585,45 @@ Following the 5-step integration from [agentskills.io](https://agentskills.io/in
 ---
 
 **ℹ️ Execution Info:** Used tool `{exec_info['tool_used']}`, generated {exec_info['output_size']} bytes"""
-                
-                step_info['status'] = 'completed'
-                yield success_msg, step_info, exec_info['ics_content']
-            else:
-                step_info['status'] = 'failed'
-                yield f"❌ Error: {exec_info.get('error', 'Unknown error')}", step_info, None
-        
-        elif matched_skill == "nvidia-ideagen":
-            for chunk, exec_info in self.step5_execute_ideagen_skill(user_query, temperature):
-                step_info['status'] = 'executing'
-                yield chunk, step_info, None
-            
-            # Mark as completed
+            
             step_info['status'] = 'completed'
-            yield f"\n\n---\n\n**ℹ️ Execution Info:** Used tool `{exec_info['tool_used']}` with parameters: {exec_info.get('parameters', {})}", step_info, None
-
+            yield success_msg, step_info, exec_info['ics_content']
+        else:
+            step_info['status'] = 'failed'
+            yield f"❌ Error: {exec_info.get('error', 'Unknown error')}", step_info, None
+    
+    async def _run_ideagen_flow(
+        self, 
+        user_query: str, 
+        query_lower: str, 
+        temperature: float, 
+        step_info: dict
+    ):
+        """Step 5 output for nvidia-ideagen: streamed ideas plus execution info"""
+        async for chunk, exec_info in self.step5_execute_ideagen_skill(user_query, temperature, query_lower):
+            step_info['status'] = 'executing'
+            yield chunk, step_info, None
+        
+        # Mark as completed
+        step_info['status'] = 'completed'
+        yield f"\n\n---\n\n**ℹ️ Execution Info:** Used tool `{exec_info['tool_used']}` with parameters: {exec_info.get('parameters', {})}", step_info, None
 
 class GradioUI:
     """Gradio UI for Agent Skills Chatbot"""
     
+    # Minimum seconds between chat re-renders while a response streams
+    stream_update_interval = 0.05
+    
+    # Example queries offered under the chat box
+    example_queries = (
+        "Schedule a team meeting tomorrow at 2pm for 2 hours",
+        "Create a dentist appointment next Monday at 10am",
+        "Book lunch Friday at noon with marketing team",
+        "Generate 3 ideas for sustainable urban living",
+        "I need ideas for a language learning mobile app",
+        "Brainstorm AI-powered productivity tools",
+    )
+    
     def __init__(self, chatbot: AgentSkillsChatbot):
         self.chatbot = chatbot
     
@@ -522,10 +642,10 @@ class GradioUI:
         
         return temp_file.name
     
-    def process_message(
+    async def process_message(
         self, 
         user_message: str, 
-        history: List[List[str]],
+        history: List[dict],
         temperature: float
     ):
         """
@@ -537,33 +657,59 @@ class GradioUI:
             yield history, None, ""
             return
         
-        # Add user message to history
+        # Add user message and the assistant reply being streamed to history
         history = history or []
-        history.append([user_message, ""])
+        history.append({"role": "user", "content": user_message})
+        reply = {"role": "assistant", "content": ""}
+        history.append(reply)
         
-        # Stream response with step-by-step progress
-        response = ""
+        # Stream response with step-by-step progress; chunks are joined only
+        # when the chat is re-rendered
+        response_parts = []
         ics_content_bytes = None
         activated_skill = None
+        last_emit = 0.0
+        last_step = None
+        
+        # The first render clears the previous download and preview; after
+        # that gr.update() leaves both untouched instead of resending them
+        file_out, preview_out = None, ""
         
-        for chunk, step_info, ics_bytes in self.chatbot.chat_stream(
+        async for chunk, step_info, ics_bytes in self.chatbot.chat_stream(
             user_message, 
             temperature=temperature
         ):
-            response += chunk
+            # Empty deltas (e.g. role-only stream chunks) change nothing on
+            # screen, so don't spend a re-render on them
+            if not chunk and not ics_bytes:
+                continue
+            
+            response_parts.append(chunk)
             
             # Track which skill was activated
             if step_info and 'skill_name' in step_info and not activated_skill:
                 activated_skill = step_info['skill_name']
             
-            # Update chat with current response
-            history[-1][1] = response
-            
             # Store ICS content if returned
             if ics_bytes:
                 ics_content_bytes = ics_bytes
             
-            yield history, None, ""
+            # Each yield re-renders the whole chat, so coalesce token-level
+            # chunks; the final state is always yielded after the loop. A new
+            # step is always shown right away: the slow awaits (the LLM call,
+            # step 5 execution) come right after one, and holding its line
+            # back would leave the chat frozen until they finish.
+            step = step_info.get('step') if step_info else None
+            now = time.monotonic()
+            if step != last_step or now - last_emit >= self.stream_update_interval:
+                last_step = step
+                last_emit = now
+                reply["content"] = "".join(response_parts)
+                yield history, file_out, preview_out
+                file_out = preview_out = gr.update()
+        
+        # Update chat with the complete response
+        reply["content"] = "".join(response_parts)
         
         # If we have ICS content, save it
         if ics_content_bytes:
@@ -571,11 +717,12 @@ class GradioUI:
             ics_preview = ics_content_bytes.decode('utf-8')
             
             # Extract summary for filename
-            summary_match = re.search(r'SUMMARY:(.*?)(?:\r?\n)', ics_preview)
+            summary_match = _ICS_SUMMARY_RE.search(ics_preview)
             summary = summary_match.group(1) if summary_match else "event"
             
-            # Save to temp file
-            file_path = self.save_ics_file(ics_content_bytes, summary)
+            # Save to temp file off the event loop so a slow disk doesn't
+            # stall other sessions
+            file_path = await asyncio.to_thread(self.save_ics_file, ics_content_bytes, summary)
             
             # Return with file and preview
             yield history, file_path, ics_preview
@@ -584,10 +731,18 @@ class GradioUI:
         # Final yield
         yield history, None, ""
     
-    def clear_history(self):
+    # The two handlers below only return constants. As coroutines Gradio
+    # runs them on the event loop instead of dispatching each call to its
+    # worker thread pool.
+    
+    async def clear_history(self):
         """Clear chat history"""
         return []
     
+    async def clear_input(self):
+        """Clear the message box after a message is sent"""
+        return ""
+    
     def build_interface(self) -> gr.Blocks:
         """Build Gradio interface"""
         
@@ -616,12 +771,7 @@ class GradioUI:
             )
             
             # Display discovered skills
-            skills_info = ""
-            for skill in self.chatbot.skills:
-                skills_info += f"- **{skill.name}** ({skill.skill_type})\n"
-                skills_info += f"  - {skill.description}\n"
-            
-            gr.Markdown(skills_info)
+            gr.Markdown(self.chatbot.skills_markdown)
             
             gr.Markdown(
                 """
@@ -649,6 +799,7 @@ class GradioUI:
                         label="Chat",
                         height=500,
                         show_label=True,
+                        type="messages",
                     )
                     
                     with gr.Row():
@@ -676,17 +827,13 @@ class GradioUI:
                     """)
                     
                     # Examples
+                    # gr.Examples only accepts a list; examples have no fn to
+                    # cache, so never build an example cache at startup
                     gr.Examples(
-                        examples=[
-                            "Schedule a team meeting tomorrow at 2pm for 2 hours",
-                            "Create a dentist appointment next Monday at 10am",
-                            "Book lunch Friday at noon with marketing team",
-                            "Generate 3 ideas for sustainable urban living",
-                            "I need ideas for a language learning mobile app",
-                            "Brainstorm AI-powered productivity tools"
-                        ],
+                        examples=list(self.example_queries),
                         inputs=user_input,
-                        label="💡 Try these examples"
+                        label="💡 Try these examples",
+                        cache_examples=False
                     )
             
             # Settings
@@ -706,22 +853,14 @@ class GradioUI:
             # Hidden preview textbox
             ics_preview = gr.Textbox(visible=False)
             
-            # Event handlers
-            submit_btn.click(
-                fn=self.process_message,
-                inputs=[user_input, chatbot, temperature],
-                outputs=[chatbot, ics_download, ics_preview]
-            ).then(
-                fn=lambda: "",
-                outputs=[user_input]
-            )
-            
-            user_input.submit(
+            # Event handlers: Send button and Enter share one event
+            gr.on(
+                triggers=[submit_btn.click, user_input.submit],
                 fn=self.process_message,
                 inputs=[user_input, chatbot, temperature],
                 outputs=[chatbot, ics_download, ics_preview]
             ).then(
-                fn=lambda: "",
+                fn=self.clear_input,
                 outputs=[user_input]
             )
             
@@ -807,6 +946,11 @@ def main():
                 for tool in tools[:3]:  # Show first 3
                     print(f"     - {tool._tool_name}")
         
+        # Pay the calendar skill's model lookup now, not on the first request
+        if chatbot.calendar_skill:
+            print("\n🔥 Prewarming calendar skill...")
+            chatbot.calendar_skill.prewarm()
+        
         print("\n" + "="*80)
         print("✅ Initialization complete! Launching Gradio interface...")
         print("="*80 + "\n")
@@ -815,9 +959,17 @@ def main():
         ui = GradioUI(chatbot)
         interface = ui.build_interface()
         
+        # Gradio runs one event at a time by default; chats mostly wait on
+        # the NVIDIA API, so let several sessions stream concurrently
+        interface.queue(
+            default_concurrency_limit=max(4, os.cpu_count() or 4),
+            max_size=64
+        )
+        
         # Launch
+        # Bind to loopback unless HOST asks for more (e.g. 0.0.0.0 in a container)
         interface.launch(
-            server_name="0.0.0.0",
+            server_name=os.getenv("HOST", "127.0.0.1"),
             server_port=7860,
             share=False
         )
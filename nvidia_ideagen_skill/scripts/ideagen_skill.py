@@ -10,8 +10,8 @@ Includes @skill_tool decorated functions for NAT auto-discovery.
 
 import os
 import sys
-from openai import OpenAI
-from typing import Generator, Dict, List, Optional, Any
+from openai import AsyncOpenAI, OpenAI
+from typing import AsyncGenerator, Generator, Dict, List, Optional, Any
 import json
 from datetime import datetime
 from pathlib import Path
@@ -37,6 +37,15 @@ except ImportError:
                 return func
             return decorator
 
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 
 class NvidiaIdeaGenSkill:
     """
@@ -49,13 +58,20 @@ class NvidiaIdeaGenSkill:
     4. Calls this implementation
     """
     
-    def __init__(self, api_key: Optional[str] = None, ideas_dir: Optional[str] = None):
+    def __init__(
+        self, 
+        api_key: Optional[str] = None, 
+        ideas_dir: Optional[str] = None,
+        async_client: Optional[AsyncOpenAI] = None
+    ):
         """
         Initialize the NVIDIA idea generation skill
         
         Args:
             api_key: NVIDIA API key (defaults to NVIDIA_API_KEY env var)
             ideas_dir: Custom directory for saved ideas (defaults to 'ideas/')
+            async_client: AsyncOpenAI client for agenerate_ideas_stream, e.g. to
+                share a host app's connection pool (created on first use if omitted)
         
         Raises:
             ValueError: If NVIDIA_API_KEY is not set
@@ -72,6 +88,7 @@ class NvidiaIdeaGenSkill:
             api_key=self.api_key
         )
         self.model = "nvidia/llama-3.1-nemotron-nano-8b-v1"
+        self._async_client = async_client
         
         # Create directory for saved ideas
         self.ideas_dir = Path(ideas_dir) if ideas_dir else Path("ideas")
@@ -102,34 +119,15 @@ class NvidiaIdeaGenSkill:
         Yields:
             Streamed text chunks
         """
-        if not topic or not topic.strip():
-            yield "❌ Error: Topic cannot be empty. Please provide a topic to generate ideas about."
-            return
-        
-        if not 1 <= num_ideas <= 10:
-            yield f"❌ Error: num_ideas must be between 1 and 10, got {num_ideas}"
+        error = self._validate_request(topic, num_ideas)
+        if error:
+            yield error
             return
         
-        # Build prompts with skill awareness
-        system_prompt = self._build_system_prompt()
-        user_prompt = self._build_user_prompt(topic, num_ideas, context)
-        
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
-        
         try:
             # Stream the response
             completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=creativity,
-                top_p=0.95,
-                max_tokens=4096,
-                frequency_penalty=0.2,
-                presence_penalty=0.1,
-                stream=True
+                **self._stream_request(topic, num_ideas, context, creativity)
             )
             
             for chunk in completion:
@@ -139,6 +137,88 @@ class NvidiaIdeaGenSkill:
         except Exception as e:
             yield f"\n\n❌ Error generating ideas: {str(e)}\n\nPlease try again or check your API key."
     
+    async def agenerate_ideas_stream(
+        self, 
+        topic: str, 
+        num_ideas: int = 5, 
+        context: str = "",
+        creativity: float = 0.7
+    ) -> AsyncGenerator[str, None]:
+        """
+        Async version of generate_ideas_stream
+        
+        Streams over the async OpenAI client, so an event loop (e.g. Gradio)
+        can serve other requests while tokens arrive instead of holding a
+        worker thread for the whole generation.
+        
+        Args:
+            topic: The topic to generate ideas about
+            num_ideas: Number of ideas to generate (1-10)
+            context: Additional context or constraints
+            creativity: Temperature setting (0-1, higher = more creative)
+        
+        Yields:
+            Streamed text chunks
+        """
+        error = self._validate_request(topic, num_ideas)
+        if error:
+            yield error
+            return
+        
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(
+                base_url="https://integrate.api.nvidia.com/v1",
+                api_key=self.api_key
+            )
+        
+        try:
+            completion = await self._async_client.chat.completions.create(
+                **self._stream_request(topic, num_ideas, context, creativity)
+            )
+            
+            async for chunk in completion:
+                if chunk.choices[0].delta.content is not None:
+                    yield chunk.choices[0].delta.content
+        
+        except Exception as e:
+            yield f"\n\n❌ Error generating ideas: {str(e)}\n\nPlease try again or check your API key."
+    
+    def _validate_request(self, topic: str, num_ideas: int) -> Optional[str]:
+        """Return an error message for invalid idea generation arguments"""
+        if not topic or not topic.strip():
+            return "❌ Error: Topic cannot be empty. Please provide a topic to generate ideas about."
+        
+        if not 1 <= num_ideas <= 10:
+            return f"❌ Error: num_ideas must be between 1 and 10, got {num_ideas}"
+        
+        return None
+    
+    def _stream_request(
+        self, 
+        topic: str, 
+        num_ideas: int, 
+        context: str, 
+        creativity: float
+    ) -> Dict[str, Any]:
+        """Build the streaming chat completion arguments for an idea request"""
+        # Build prompts with skill awareness
+        system_prompt = self._build_system_prompt()
+        user_prompt = self._build_user_prompt(topic, num_ideas, context)
+        
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": creativity,
+            "top_p": 0.95,
+            "max_tokens": 4096,
+            "frequency_penalty": 0.2,
+            "presence_penalty": 0.1,
+            "stream": True
+        }
+    
     def generate_ideas(
         self, 
         topic: str, 
@@ -866,7 +946,7 @@ if __name__ == "__main__":
         # Show skill info
         info = skill.get_skill_info()
         print("📊 Skill Information:")
-        print(json.dumps(info, indent=2))
+        print(_json_dumps(info))
         print("\n" + "="*60 + "\n")
         
         # Test idea generation
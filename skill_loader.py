@@ -13,19 +13,33 @@ Based on the OpenSkills directory structure with AI Planner enhancements:
 import functools
 import importlib.util
 import inspect
+import os
 import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, get_type_hints
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, get_type_hints
 import yaml
 
-try:
-    from pydantic import BaseModel, create_model, Field
-    from langchain.tools import StructuredTool
-    LANGCHAIN_AVAILABLE = True
-except ImportError:
-    LANGCHAIN_AVAILABLE = False
-    BaseModel = None
-    StructuredTool = None
+# Prefer the libyaml-backed loader when PyYAML was built with it; parsing
+# config.yaml and SKILL.md frontmatter dominates skill discovery
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _module_available(name: str) -> bool:
+    """True if a module can be found; a dotted name imports only its parent packages"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# pydantic and langchain are only needed to build StructuredTools. Check for
+# them without importing StructuredTool, so skill scripts that import this
+# module just for @skill_tool don't pay for it. The import sites below still
+# handle ImportError in case langchain.tools is present but broken.
+LANGCHAIN_AVAILABLE = _module_available("pydantic") and _module_available("langchain.tools")
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 
 # ============================================================================
@@ -88,12 +102,23 @@ def skill_tool(
 # ============================================================================
 
 class SkillMetadata:
-    """Container for skill metadata from config.yaml and SKILL.md"""
+    """
+    Container for skill metadata from config.yaml and SKILL.md
+    
+    Only the SKILL.md frontmatter is read at discovery; the instructions body
+    (skill_md_content) is loaded on first access, when a skill is activated.
+    """
+    
+    # Block size for scanning SKILL.md up to the end of its frontmatter
+    _FRONTMATTER_READ_SIZE = 4096
     
     def __init__(self, skill_path: Path):
         self.skill_path = skill_path
         self.config = self._load_config()
-        self.skill_md_metadata, self.skill_md_content = self._load_skill_md()
+        self.skill_md_metadata = self._load_skill_md_metadata()
+        # Subdirectory names (references/, assets/, ...) scanned once here so
+        # request-time checks never touch the filesystem
+        self.subdirs = self._scan_subdirs()
         # Set name from config, SKILL.md, or fallback to directory name
         self.name = (
             self.config.get('name') or 
@@ -106,9 +131,40 @@ class SkillMetadata:
         config_path = self.skill_path / "config.yaml"
         if config_path.exists():
             with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=_YamlLoader) or {}
         return {}
     
+    def _load_skill_md_metadata(self) -> Dict[str, Any]:
+        """Parse SKILL.md frontmatter without reading the instructions body"""
+        skill_md_path = self.skill_path / "SKILL.md"
+        if not skill_md_path.exists():
+            return {}
+        
+        with open(skill_md_path, 'r', encoding='utf-8') as f:
+            head = f.read(self._FRONTMATTER_READ_SIZE)
+            if not head.startswith("---"):
+                return {}
+            
+            end = head.find("---", 3)
+            while end == -1:
+                block = f.read(self._FRONTMATTER_READ_SIZE)
+                if not block:
+                    return {}
+                # Rescan the last two characters in case "---" spans blocks
+                start = max(len(head) - 2, 3)
+                head += block
+                end = head.find("---", start)
+        
+        try:
+            return yaml.load(head[3:end], Loader=_YamlLoader) or {}
+        except yaml.YAMLError:
+            return {}
+    
+    @functools.cached_property
+    def skill_md_content(self) -> str:
+        """Full SKILL.md instructions (body after the frontmatter)"""
+        return self._load_skill_md()[1]
+    
     def _load_skill_md(self) -> tuple[Dict[str, Any], str]:
         """Load and parse SKILL.md frontmatter and content"""
         skill_md_path = self.skill_path / "SKILL.md"
@@ -123,7 +179,7 @@ class SkillMetadata:
             parts = content.split("---", 2)
             if len(parts) >= 3:
                 try:
-                    metadata = yaml.safe_load(parts[1]) or {}
+                    metadata = yaml.load(parts[1], Loader=_YamlLoader) or {}
                     body = parts[2].strip()
                     return metadata, body
                 except yaml.YAMLError:
@@ -131,6 +187,21 @@ class SkillMetadata:
         
         return {}, content
     
+    def _scan_subdirs(self) -> frozenset:
+        """Names of the skill's subdirectories, from a single directory scan"""
+        with os.scandir(self.skill_path) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_dir())
+    
+    @property
+    def has_references(self) -> bool:
+        """Whether the skill ships a references/ directory"""
+        return "references" in self.subdirs
+    
+    @property
+    def has_assets(self) -> bool:
+        """Whether the skill ships an assets/ directory"""
+        return "assets" in self.subdirs
+    
     @property
     def description(self) -> str:
         """Get skill description for LLM-based routing"""
@@ -198,6 +269,8 @@ class SkillLoader:
         """
         self.skills_base_path = Path(skills_base_path)
         self.skills: Dict[str, SkillMetadata] = {}
+        # discover_tools() results by skill name; scripts are executed once
+        self._tools_cache: Dict[str, List[Callable]] = {}
         self.discover_skills()
     
     def discover_skills(self) -> List[SkillMetadata]:
@@ -208,15 +281,19 @@ class SkillLoader:
             List of discovered skill metadata
         """
         self.skills = {}
+        self._tools_cache = {}
         
         if not self.skills_base_path.exists():
             return []
         
-        # Find all directories with SKILL.md
-        for skill_dir in self.skills_base_path.iterdir():
-            if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-                metadata = SkillMetadata(skill_dir)
-                self.skills[metadata.name] = metadata
+        # Find all directories with SKILL.md; scandir's entries know whether
+        # they are directories without a stat call per entry
+        with os.scandir(self.skills_base_path) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "SKILL.md")):
+                    skill_dir = Path(entry.path)
+                    metadata = SkillMetadata(skill_dir)
+                    self.skills[metadata.name] = metadata
         
         return list(self.skills.values())
     
@@ -281,12 +358,21 @@ class SkillLoader:
         """
         Auto-discover @skill_tool decorated functions from a skill's scripts/
         
+        Each skill's scripts are imported once; later calls return the cached
+        tools until discover_skills() runs again.
+        
         Args:
             skill_name: Name of the skill to discover tools from
         
         Returns:
             List of discovered tool functions
         """
+        if skill_name not in self._tools_cache:
+            self._tools_cache[skill_name] = self._load_tools(skill_name)
+        return list(self._tools_cache[skill_name])
+    
+    def _load_tools(self, skill_name: str) -> List[Callable]:
+        """Import a skill's scripts/ and collect its @skill_tool functions"""
         skill = self.get_skill(skill_name)
         if not skill:
             return []
@@ -345,6 +431,14 @@ class SkillLoader:
                 "Install with: pip install langchain pydantic"
             )
         
+        try:
+            from langchain.tools import StructuredTool
+        except ImportError as e:
+            raise ImportError(
+                f"langchain.tools.StructuredTool could not be imported ({e}). "
+                "Install with: pip install -U langchain pydantic"
+            ) from e
+        
         discovered_tools = self.discover_tools(skill_name)
         langchain_tools = []
         
@@ -374,7 +468,7 @@ class SkillLoader:
         
         return langchain_tools
     
-    def _create_pydantic_model_from_function(self, func: Callable) -> Type[BaseModel]:
+    def _create_pydantic_model_from_function(self, func: Callable) -> Type["BaseModel"]:
         """
         Generate a Pydantic model from function type hints
         
@@ -384,6 +478,8 @@ class SkillLoader:
         Returns:
             Pydantic BaseModel class for input validation
         """
+        from pydantic import Field, create_model
+        
         type_hints = get_type_hints(func)
         sig = inspect.signature(func)
         
@@ -423,6 +519,12 @@ class SkillLoader:
         if not LANGCHAIN_AVAILABLE:
             return []
         
+        try:
+            from langchain.tools import StructuredTool
+            from pydantic import Field, create_model
+        except ImportError:
+            return []
+        
         skill_path = skill.skill_path
         
         # read_reference tool
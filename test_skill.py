@@ -83,6 +83,43 @@ class TestResults:
             return 1
 
 
+class FakeCalendarLLM:
+    """
+    Offline stand-in for ChatNVIDIA in calendar skill tests
+    
+    Replies are looked up by a phrase contained in the request text. Batch
+    requests (numbered lists) get a JSON array with one reply per line;
+    requests matching no phrase get a reply that contains no JSON.
+    """
+    
+    def __init__(self, replies: dict):
+        self.replies = replies
+        self.calls = 0
+    
+    def with_structured_output(self, schema):
+        raise NotImplementedError("raw JSON replies only")
+    
+    def _reply_for(self, text: str):
+        text = text.lower()
+        for phrase, reply in self.replies.items():
+            if phrase in text:
+                return reply
+        return None
+    
+    def invoke(self, messages, **kwargs):
+        from types import SimpleNamespace
+        self.calls += 1
+        text = messages[-1].content
+        if "Requests:" in text:
+            lines = text.split("Requests:\n", 1)[1].splitlines()
+            return SimpleNamespace(content=json.dumps([self._reply_for(line) for line in lines]))
+        reply = self._reply_for(text)
+        return SimpleNamespace(content=json.dumps(reply) if reply else "No event found.")
+    
+    async def ainvoke(self, messages, **kwargs):
+        return self.invoke(messages, **kwargs)
+
+
 def test_skill_loader_import():
     """Test 1: Import SkillLoader"""
     print_test("Import SkillLoader Module")
@@ -410,6 +447,14 @@ def test_calendar_skill_execution():
             print_success(f"  Event: {result['event_summary']}")
             print_success(f"  File size: {result['file_size']} bytes")
             
+            # The file must hold the exact bytes: CRLF line endings, no
+            # text-mode translation (which writes CR CR LF on Windows)
+            written = Path(result['file_path']).read_bytes()
+            if b"\r\r\n" in written or len(written) != result['file_size'] \
+                    or not written.endswith(b"END:VCALENDAR\r\n"):
+                print_error("  Written file differs from the generated ICS bytes")
+                return False, "ICS file not written in binary mode"
+            
             # Clean up test file
             try:
                 Path(result['file_path']).unlink()
@@ -419,10 +464,24 @@ def test_calendar_skill_execution():
             print_error(f"  Failed: {result.get('error', 'Unknown error')}")
             return False, "ICS creation failed"
         
-        # Test 3: Parse calendar event (requires API key)
+        # Test 3: Bad input comes back as an error dict naming the problem
+        print_info("\n3. Testing create_ics_file error reporting...")
+        bad_inputs = [
+            (dict(summary="", start_date=tomorrow), "summary is required"),
+            (dict(summary="Test", start_date="2026-13-45"), "Invalid date/time format"),
+            (dict(summary="Test", start_date=tomorrow, duration_hours="2"), "Error creating ICS file"),
+        ]
+        for kwargs, expected in bad_inputs:
+            error = create_ics_file(**kwargs).get("error", "")
+            if expected not in error:
+                print_error(f"  {kwargs}: expected '{expected}', got '{error}'")
+                return False, "Unexpected create_ics_file error"
+            print_success(f"  {error}")
+        
+        # Test 4: Parse calendar event (requires API key)
         api_key = os.environ.get('NVIDIA_API_KEY')
         if api_key:
-            print_info("\n3. Testing parse_calendar_event...")
+            print_info("\n4. Testing parse_calendar_event...")
             parsed = parse_calendar_event("Meeting tomorrow at 3pm for 2 hours")
             
             if "error" in parsed:
@@ -443,8 +502,87 @@ def test_calendar_skill_execution():
         return False, str(e)
 
 
+def test_ics_fast_path_parity():
+    """Test 9: Direct ICS serializer matches icalendar output"""
+    print_test("ICS Fast Path Parity with icalendar")
+    
+    try:
+        sys.path.insert(0, str(Path(__file__).parent))
+        import hashlib
+        import zoneinfo
+        from datetime import timezone
+        from calendar_assistant_skill.scripts import calendar_skill
+        
+        skill = calendar_skill.CalendarAssistantSkill(default_timezone="Europe/Paris")
+        dtstamp = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        cases = [
+            dict(summary="Team Meeting", description="Quarterly planning", location="Room A"),
+            dict(summary="Lunch, snacks; and \\ more", description="line 1\nline 2\r\nline 3"),
+            dict(summary="Réunion 日本 😀 " * 8, location="x" * 200, reminder_hours=0.5),
+            dict(summary="No reminder", reminder_hours=0, duration_hours=36),
+            dict(summary="UTC-equivalent zone",
+                 start_datetime=datetime(2026, 3, 1, 8, 0, tzinfo=zoneinfo.ZoneInfo("Africa/Abidjan"))),
+            dict(summary="With people", organizer_email="lead@example.com", organizer_name="Team Lead",
+                 attendees=[{"email": "john@example.com", "name": "John Doe"},
+                            {"email": "jane@example.com", "name": "Smith, Jane", "role": "OPT-PARTICIPANT"},
+                            {"name": "No email"}]),
+            dict(summary="Ends with a backslash \\", description="trailing \\",
+                 location="C:\\Users\\"),
+            dict(summary="CRLF inside", description="a\r\nb\r\n\r\nc\r\n", location="lone\rCR"),
+        ]
+        # Multi-byte characters straddling the 75-octet fold boundary
+        for pad in range(60, 68):
+            cases.append(dict(summary="s" * pad + "é日😀" * 3, description="d" * pad + "日😀é" * 3))
+        
+        fast_serializer = calendar_skill._fast_ics_bytes
+        for case in cases:
+            case.setdefault("start_datetime", datetime(2026, 1, 13, 14, 0, tzinfo=skill._tz))
+            fast = skill.create_calendar_event(dtstamp=dtstamp, **case)
+            try:
+                calendar_skill._fast_ics_bytes = lambda *args, **kwargs: None
+                reference = skill.create_calendar_event(dtstamp=dtstamp, **case)
+            finally:
+                calendar_skill._fast_ics_bytes = fast_serializer
+            
+            if fast != reference:
+                print_error(f"  Mismatch for: {case['summary'][:40]}")
+                return False, "Fast ICS output differs from icalendar"
+            # Folded lines stay within 75 octets and never split a character
+            for line in fast.split(b"\r\n"):
+                if len(line) > 75:
+                    return False, f"Line longer than 75 octets: {line[:40]!r}"
+                line.decode("utf-8")
+            print_success(f"  Identical output: {case['summary'][:40]}")
+        
+        # The escaping and folding helpers on their own
+        from calendar_assistant_skill.scripts.calendar_fastpath import ics_fold, ics_text
+        if ics_text("ends with \\") != "ends with \\\\" or ics_text("a\r\nb\rc") != "a\\nb\\nc":
+            return False, "ics_text escaping changed"
+        for text in ("x" * 65 + "é", "x" * 64 + "日", "x" * 66 + "😀" * 3, "é" * 80):
+            parts = ics_fold("SUMMARY:" + text).split("\r\n ")
+            if "".join(parts) != "SUMMARY:" + text or any(len(p.encode("utf-8")) >= 75 for p in parts):
+                return False, f"ics_fold split {text[-4:]!r} incorrectly"
+        print_success("  ics_text / ics_fold edge cases")
+        
+        # UIDs are the 128-bit BLAKE2b of summary + start, on both paths
+        start = datetime(2026, 1, 13, 14, 0, tzinfo=skill._tz)
+        uid = hashlib.blake2b(f"Team Meeting{start.isoformat()}".encode('utf-8'), digest_size=16).hexdigest()
+        ics = skill.create_calendar_event("Team Meeting", start, dtstamp=dtstamp)
+        if f"UID:{uid}@calendar-assistant-skill".encode() not in ics:
+            print_error("  UID is not BLAKE2b-128 of summary + start")
+            return False, "Unexpected UID format"
+        print_success(f"  UID: {uid}@calendar-assistant-skill")
+        
+        return True, f"{len(cases)} events serialized identically"
+    
+    except Exception as e:
+        print_error(f"ICS parity check failed: {e}")
+        traceback.print_exc()
+        return False, str(e)
+
+
 def test_ideagen_skill_execution():
-    """Test 9: IdeaGen Skill Execution"""
+    """Test 10: IdeaGen Skill Execution"""
     print_test("Execute NVIDIA IdeaGen Skill Tools")
     
     try:
@@ -523,7 +661,7 @@ def test_ideagen_skill_execution():
 
 
 def test_skills_xml_generation():
-    """Test 10: Skills XML Generation for LLM"""
+    """Test 11: Skills XML Generation for LLM"""
     print_test("Generate Skills XML for LLM Prompt Injection")
     
     try:
@@ -557,7 +695,7 @@ def test_skills_xml_generation():
 
 
 def test_pydantic_model_generation():
-    """Test 11: Pydantic Model Auto-Generation"""
+    """Test 12: Pydantic Model Auto-Generation"""
     print_test("Auto-Generate Pydantic Models from Type Hints")
     
     try:
@@ -603,7 +741,7 @@ def test_pydantic_model_generation():
 
 
 def test_directory_structure():
-    """Test 12: Directory Structure Compliance"""
+    """Test 13: Directory Structure Compliance"""
     print_test("Verify OpenSkills Directory Structure")
     
     try:
@@ -682,6 +820,251 @@ def test_directory_structure():
         return False, str(e)
 
 
+def test_calendar_batch_filenames():
+    """Test 14: Batch tool writes one file per event, in input order"""
+    print_test("Calendar Batch Tool Filenames")
+    
+    try:
+        import tempfile
+        sys.path.insert(0, str(Path(__file__).parent))
+        from calendar_assistant_skill.scripts import calendar_skill
+        
+        skill = calendar_skill._get_skill_instance()
+        original_llm = skill.llm
+        skill.llm = FakeCalendarLLM({
+            "standup 9am": {"summary": "Standup", "start_date": "2026-01-13", "start_time": "09:00"},
+            "standup 4pm": {"summary": "Standup", "start_date": "2026-01-13", "start_time": "16:00"},
+            "dentist": {"summary": "Dentist", "start_date": "2026-01-16", "start_time": "10:30"},
+        })
+        cwd = os.getcwd()
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                os.chdir(tmp)
+                results = calendar_skill.natural_language_to_calendar_batch(
+                    ["standup 9am tomorrow", "dentist friday", "standup 4pm tomorrow"]
+                )
+                
+                names = [os.path.basename(r.get("file_path", "")) for r in results]
+                print_info(f"Files: {names}")
+                if names != ["Standup_2026-01-13.ics", "Dentist_2026-01-16.ics", "Standup_2026-01-13_2.ics"]:
+                    print_error("  Unexpected filenames (same title and date must not collide)")
+                    return False, "Batch filenames collide or are out of order"
+                
+                written = [Path(r["file_path"]).read_bytes() for r in results]
+                if any(b"\r\r\n" in data or len(data) != r["file_size"] for data, r in zip(written, results)):
+                    print_error("  Written files differ from the generated ICS bytes")
+                    return False, "ICS files not written in binary mode"
+                
+                starts = [data.count(b"T090000") for data in written]
+                if starts != [1, 0, 0] or results[2]["parsed_data"]["start_time"] != "16:00":
+                    print_error("  File contents don't match their requests")
+                    return False, "Batch file contents mismatched"
+                print_success("  3 requests -> 3 distinct files, in input order")
+        finally:
+            os.chdir(cwd)
+            skill.llm = original_llm
+        
+        return True, "Same-day events with one title get distinct files"
+    
+    except Exception as e:
+        print_error(f"Calendar batch filename check failed: {e}")
+        traceback.print_exc()
+        return False, str(e)
+
+
+# Replies shared by the offline calendar tests below
+_CALENDAR_REPLIES = {
+    "standup 9am": {"summary": "Standup", "start_date": "2026-01-13", "start_time": "09:00"},
+    "standup 4pm": {"summary": "Standup", "start_date": "2026-01-13", "start_time": "16:00"},
+    "dentist": {"summary": "Dentist", "start_date": "2026-01-16", "start_time": "10:30",
+                "location": "Main St"},
+}
+
+
+def test_calendar_parse_caches():
+    """Test 15: Parse caches skip repeat LLM calls and hand out copies"""
+    print_test("Calendar Parse Caches")
+    
+    try:
+        import tempfile
+        import time
+        sys.path.insert(0, str(Path(__file__).parent))
+        from calendar_assistant_skill.scripts import calendar_skill
+        
+        today = datetime(2026, 1, 12, 9, 0)
+        
+        # 1. In-memory LRU: normalized repeats hit, hits are independent copies
+        skill = calendar_skill.CalendarAssistantSkill()
+        skill.llm = FakeCalendarLLM(_CALENDAR_REPLIES)
+        first, _ = skill.parse_natural_language("Dentist on Friday", today)
+        first["summary"] = "changed by caller"
+        second, _ = skill.parse_natural_language("  dentist ON friday ", today.replace(hour=18))
+        second["location"] = "changed again"
+        third, _ = skill.parse_natural_language("dentist on friday", today)
+        if skill.llm.calls != 1 or second["summary"] != "Dentist" or third["location"] != "Main St":
+            print_error(f"  LRU cache: {skill.llm.calls} LLM calls, hit = {third}")
+            return False, "LRU parse cache miss or shared dict"
+        print_success("  LRU: 3 parses, 1 LLM call, hits are independent copies")
+        
+        # A different calendar day resolves "Friday" differently, so it misses
+        skill.parse_natural_language("dentist on friday", today + timedelta(days=1))
+        if skill.llm.calls != 2:
+            return False, "LRU parse cache ignored the reference date"
+        print_success("  LRU: a new reference day calls the LLM again")
+        
+        # 2. SQLite: a second instance (e.g. after a restart) reuses the parse
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "parses.db")
+            writer = calendar_skill.CalendarAssistantSkill(cache_db_path=db_path)
+            writer.llm = FakeCalendarLLM(_CALENDAR_REPLIES)
+            expected, _ = writer.parse_natural_language("standup 9am tomorrow", today)
+            
+            reader = calendar_skill.CalendarAssistantSkill(cache_db_path=db_path)
+            reader.llm = FakeCalendarLLM(_CALENDAR_REPLIES)
+            cached, _ = reader.parse_natural_language("standup 9am tomorrow", today)
+            reader._persistent_cache._db.close()
+            writer._persistent_cache._db.close()
+            if reader.llm.calls != 0 or cached != expected:
+                print_error(f"  SQLite cache: {reader.llm.calls} LLM calls, got {cached}")
+                return False, "SQLite parse cache miss"
+        print_success("  SQLite: a fresh instance reads the parse without an LLM call")
+        
+        # 3. Semantic: optional dependencies
+        if calendar_skill.SEMANTIC_CACHE_AVAILABLE:
+            semantic = calendar_skill.CalendarAssistantSkill(enable_semantic_cache=True)
+            semantic.llm = FakeCalendarLLM(_CALENDAR_REPLIES)
+            semantic.parse_natural_language("dentist appointment on friday", today)
+            semantic.parse_natural_language("dentist appointment on friday please", today)
+            print_info(f"  Semantic: {semantic.llm.calls} LLM calls for a paraphrase")
+        else:
+            print_warning("  sentence-transformers/faiss not installed - skipping semantic cache")
+        
+        # 4. Failed parses are remembered for the TTL only
+        skill = calendar_skill.CalendarAssistantSkill(failed_parse_ttl=0.2)
+        skill.llm = FakeCalendarLLM({})
+        _, error = skill.parse_natural_language("a pasta recipe", today)
+        _, repeat_error = skill.parse_natural_language("A pasta recipe ", today)
+        if not error or repeat_error != error or skill.llm.calls != 1:
+            print_error(f"  Negative cache: {skill.llm.calls} LLM calls, errors {error!r} / {repeat_error!r}")
+            return False, "Failed parse not remembered"
+        time.sleep(0.25)
+        skill.parse_natural_language("a pasta recipe", today)
+        if skill.llm.calls != 2:
+            return False, "Failed parse not retried after the TTL"
+        print_success("  Negative cache: error reused within the TTL, retried after it")
+        
+        return True, "LRU, SQLite and negative parse caches behave"
+    
+    except Exception as e:
+        print_error(f"Calendar parse cache check failed: {e}")
+        traceback.print_exc()
+        return False, str(e)
+
+
+def test_calendar_batch_and_async():
+    """Test 16: Batch and async natural language entry points"""
+    print_test("Calendar Batch and Async Parsing")
+    
+    try:
+        import asyncio
+        sys.path.insert(0, str(Path(__file__).parent))
+        from calendar_assistant_skill.scripts import calendar_skill
+        
+        # 1. One LLM call for the batch, results in input order
+        skill = calendar_skill.CalendarAssistantSkill()
+        skill.llm = FakeCalendarLLM(_CALENDAR_REPLIES)
+        inputs = ["dentist friday", "standup 4pm tomorrow", "nothing to schedule", "standup 9am tomorrow"]
+        results = skill.batch_natural_language_to_ics(inputs)
+        
+        summaries = [(data or {}).get("start_time") for _, _, data in results]
+        print_info(f"Start times: {summaries}")
+        if skill.llm.calls != 1 or summaries != ["10:30", "16:00", None, "09:00"]:
+            return False, "Batch results out of order or not batched"
+        if results[2][1] is None or any(ics is None for i, (ics, _, _) in enumerate(results) if i != 2):
+            return False, "Batch errors not reported per entry"
+        print_success("  4 requests -> 1 LLM call, results in input order")
+        
+        # 2. Async pipeline returns what the sync one does
+        sync_skill = calendar_skill.CalendarAssistantSkill()
+        sync_skill.llm = FakeCalendarLLM(_CALENDAR_REPLIES)
+        async_skill = calendar_skill.CalendarAssistantSkill()
+        async_skill.llm = FakeCalendarLLM(_CALENDAR_REPLIES)
+        ics, error, data = sync_skill.natural_language_to_ics("dentist friday")
+        aics, aerror, adata = asyncio.run(async_skill.anatural_language_to_ics("dentist friday"))
+        if error or aerror or adata != data or b"SUMMARY:Dentist\r\n" not in aics:
+            print_error(f"  Async: {aerror or adata}")
+            return False, "anatural_language_to_ics differs from natural_language_to_ics"
+        if "_filename" in data:
+            return False, "Private keys leaked into parsed_data"
+        print_success("  anatural_language_to_ics matches the sync pipeline")
+        
+        return True, "Batch order and async parity hold"
+    
+    except Exception as e:
+        print_error(f"Calendar batch/async check failed: {e}")
+        traceback.print_exc()
+        return False, str(e)
+
+
+def test_calendar_output_helpers():
+    """Test 17: Bulk calendars, streamed output and filename helpers"""
+    print_test("Calendar ICS Output Helpers")
+    
+    try:
+        import io
+        from datetime import timezone
+        sys.path.insert(0, str(Path(__file__).parent))
+        from calendar_assistant_skill.scripts import calendar_skill
+        
+        skill = calendar_skill.CalendarAssistantSkill(default_timezone="Europe/Paris")
+        dtstamp = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        events = list(_CALENDAR_REPLIES.values())
+        
+        # 1. Bulk calendar = the single-event VEVENTs inside one envelope
+        bulk = skill.create_events_bulk(events, dtstamp=dtstamp)
+        header, footer = calendar_skill._VCAL_HEADER, calendar_skill._VCAL_FOOTER
+        singles = [skill.create_event_from_data(e, dtstamp=dtstamp) for e in events]
+        expected = header + b"".join(single[len(header):-len(footer)] for single in singles) + footer
+        if bulk != expected:
+            return False, "create_events_bulk differs from single-event output"
+        print_success(f"  Bulk calendar matches {len(events)} single events")
+        
+        # 2. Streaming into a binary sink writes the returned bytes
+        start = datetime(2026, 1, 13, 14, 0, tzinfo=skill._tz)
+        sink = io.BytesIO()
+        returned = skill.create_calendar_event("Sync", start, dtstamp=dtstamp, out=sink)
+        if returned is not None or sink.getvalue() != skill.create_calendar_event("Sync", start, dtstamp=dtstamp):
+            return False, "create_calendar_event(out=...) output differs"
+        print_success("  create_calendar_event(out=...) streams the same bytes")
+        
+        # 3. Filename helpers
+        sanitize = calendar_skill._sanitize_summary
+        ensure = calendar_skill._ensure_ics_name
+        checks = [
+            (sanitize("Team Meeting: Q1/Q2 review!"), "Team_Meeting_Q1Q2_review"),
+            (sanitize("  Réunion d'équipe  "), "Réunion_déquipe"),
+            (sanitize("x" * 80), "x" * 50),
+            (ensure("notes", None, None), "notes.ics"),
+            (ensure("notes.ics", "Ignored", "2026-01-13"), "notes.ics"),
+            (ensure(None, "Lunch, downtown", "2026-01-13"), "Lunch_downtown_2026-01-13.ics"),
+        ]
+        for actual, wanted in checks:
+            if actual != wanted:
+                print_error(f"  Expected {wanted!r}, got {actual!r}")
+                return False, "Filename helper output changed"
+        fallback = ensure(None, None, None)
+        if not (fallback.startswith("event_") and fallback.endswith(".ics") and fallback[6:-4].isdigit()):
+            return False, f"Unexpected fallback filename {fallback}"
+        print_success(f"  _sanitize_summary / _ensure_ics_name: {len(checks) + 1} cases")
+        
+        return True, "Bulk, streamed and filename outputs match"
+    
+    except Exception as e:
+        print_error(f"Calendar output helper check failed: {e}")
+        traceback.print_exc()
+        return False, str(e)
+
+
 def main():
     """Run all tests"""
     print_section("ExpAgentSkill - Comprehensive Test Suite")
@@ -701,10 +1084,15 @@ def main():
         ("Access Control", test_access_control),
         ("Resource Tools", test_resource_tools),
         ("Calendar Skill Execution", test_calendar_skill_execution),
+        ("ICS Fast Path Parity", test_ics_fast_path_parity),
         ("IdeaGen Skill Execution", test_ideagen_skill_execution),
         ("Skills XML Generation", test_skills_xml_generation),
         ("Pydantic Model Generation", test_pydantic_model_generation),
         ("Directory Structure", test_directory_structure),
+        ("Calendar Batch Filenames", test_calendar_batch_filenames),
+        ("Calendar Parse Caches", test_calendar_parse_caches),
+        ("Calendar Batch and Async Parsing", test_calendar_batch_and_async),
+        ("Calendar ICS Output Helpers", test_calendar_output_helpers),
     ]
     
     for test_name, test_func in tests: